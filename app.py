@@ -1,20 +1,65 @@
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from flask_caching import Cache
+from flask_compress import Compress
 from datetime import datetime
+import orjson
 import os
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider for jsonify and request.get_json backed by orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        # Dates are passed through to Flask's default handler to keep the HTTP date format
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        # orjson has no object_hook, which the session serializer needs to restore tagged values
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = 'your-secret-key-here'
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///product_readiness.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Keep enough pooled connections for concurrent page loads, and check them before reuse
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 20,
+    'max_overflow': 10,
+    'pool_pre_ping': True,
+    'pool_recycle': 300
+}
+app.config['CACHE_TYPE'] = 'SimpleCache'
+app.config['CACHE_DEFAULT_TIMEOUT'] = 300
+# Compress pages, exports and API responses; brotli for clients that accept it, gzip otherwise
+app.config['COMPRESS_MIMETYPES'] = ['text/csv', 'application/json', 'text/html']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_ALGORITHM_STREAMING'] = ['br']
+app.config['COMPRESS_BR_LEVEL'] = 5
 
 db = SQLAlchemy(app)
+cache = Cache(app)
+Compress(app)
 
 # Database Models
 
+# Rows shown on the timeline views; their planned_start_date indexes only cover these rows
+TIMELINE_ROWS_WHERE = 'planned_start_date IS NOT NULL OR planned_end_date IS NOT NULL'
+
+def timeline_index(name):
+    """Partial index on planned_start_date for the timeline filter and ordering"""
+    return db.Index(name, 'planned_start_date', sqlite_where=db.text(TIMELINE_ROWS_WHERE))
+
 class ProductFeature(db.Model):
     """Product features that can be delivered to customers"""
     __tablename__ = 'product_features'
+    __table_args__ = (timeline_index('ix_pf_timeline'),)
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False, unique=True)
@@ -58,6 +103,7 @@ class ProductFeature(db.Model):
 class TechnicalFunction(db.Model):
     """Technical functions that implement capabilities"""
     __tablename__ = 'technical_functions'
+    __table_args__ = (timeline_index('ix_tf_timeline'),)
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -189,6 +235,7 @@ class Trailer(db.Model):
 class Capabilities(db.Model):
     """Skills/abilities that make up product features and are implemented by technical functions"""
     __tablename__ = 'capabilities'
+    __table_args__ = (timeline_index('ix_cap_timeline'),)
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False, unique=True)
@@ -239,11 +286,21 @@ product_feature_dependencies = db.Table('product_feature_dependencies',
 class ReadinessAssessment(db.Model):
     """Assessment of technical function readiness for specific configurations"""
     __tablename__ = 'readiness_assessments'
+    # Reload trigger-maintained columns after flush rather than trusting RETURNING values
+    __mapper_args__ = {'eager_defaults': False}
+    __table_args__ = (
+        # Covers readiness matrix lookups by (technical function, platform, ODD, environment)
+        db.Index('ix_ra_matrix_key', 'technical_capability_id', 'vehicle_platform_id', 'odd_id', 'environment_id'),
+        # Covers milestone grouping and completion date counts on export
+        db.Index('ix_ra_scheduled_completion_date', 'scheduled_completion_date'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     technical_capability_id = db.Column(db.Integer, db.ForeignKey('technical_functions.id'), nullable=True)
     capability_id = db.Column(db.Integer, db.ForeignKey('capabilities.id'), nullable=True)
     readiness_level_id = db.Column(db.Integer, db.ForeignKey('technical_readiness_levels.id'), nullable=False)
+    # Copy of readiness_level.level kept in sync by database triggers, so level filters need no join
+    readiness_level_value = db.Column(db.SmallInteger, index=True, server_default=db.FetchedValue(), server_onupdate=db.FetchedValue())
     vehicle_platform_id = db.Column(db.Integer, db.ForeignKey('vehicle_platforms.id'), nullable=False)
     odd_id = db.Column(db.Integer, db.ForeignKey('odds.id'), nullable=False)
     environment_id = db.Column(db.Integer, db.ForeignKey('environments.id'), nullable=False)
@@ -270,6 +327,46 @@ class ReadinessAssessment(db.Model):
         return f'<ReadinessAssessment {self.technical_function.name} - TRL{self.readiness_level.level}>'
 
 
+# Triggers keeping readiness_assessments.readiness_level_value equal to the linked TRL level.
+# They cover ORM, Core and bulk inserts as well as edits to the TRL itself.
+# Written in SQLite trigger syntax; like the rest of the schema they assume the SQLite database.
+READINESS_LEVEL_VALUE_TRIGGERS = [
+    """CREATE TRIGGER IF NOT EXISTS trg_ra_level_value_insert AFTER INSERT ON readiness_assessments
+    BEGIN
+        UPDATE readiness_assessments
+        SET readiness_level_value = (SELECT level FROM technical_readiness_levels WHERE id = NEW.readiness_level_id)
+        WHERE id = NEW.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_ra_level_value_update AFTER UPDATE OF readiness_level_id ON readiness_assessments
+    BEGIN
+        UPDATE readiness_assessments
+        SET readiness_level_value = (SELECT level FROM technical_readiness_levels WHERE id = NEW.readiness_level_id)
+        WHERE id = NEW.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_trl_level_update AFTER UPDATE OF level ON technical_readiness_levels
+    BEGIN
+        UPDATE readiness_assessments SET readiness_level_value = NEW.level WHERE readiness_level_id = NEW.id;
+    END"""
+]
+
+for trigger_sql in READINESS_LEVEL_VALUE_TRIGGERS:
+    db.event.listen(ReadinessAssessment.__table__, 'after_create', db.DDL(trigger_sql))
+
+# Relationship lazy loads are logged in debug and testing, so a dropped eager-load option shows up
+# while developing; set LAZY_LOAD_RAISE=1 to fail on them instead
+app.config['LAZY_LOAD_RAISE'] = os.environ.get('LAZY_LOAD_RAISE') == '1'
+
+def report_lazy_load(orm_execute_state):
+    """Warn about, or refuse, relationship lazy loads in debug and testing"""
+    if orm_execute_state.lazy_loaded_from is None or not (app.debug or app.testing):
+        return
+    message = f"Lazy load of {orm_execute_state.loader_strategy_path[-1]}"
+    if app.config['LAZY_LOAD_RAISE']:
+        raise RuntimeError(message)
+    app.logger.warning(message)
+
+db.event.listen(db.session, 'do_orm_execute', report_lazy_load)
+
 # Import routes after models are defined
 from routes import *
 
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Database migration to create indexes declared on the models for existing databases.
+db.create_all() only creates indexes together with new tables.
+"""
+from app import app, db, ProductFeature, TechnicalFunction, Capabilities, ReadinessAssessment
+
+def migrate_indexes():
+    """Create any model indexes that are missing from the database"""
+    with app.app_context():
+        for model in (ProductFeature, TechnicalFunction, Capabilities, ReadinessAssessment):
+            for index in model.__table__.indexes:
+                print(f"Ensuring index {index.name} on {index.table.name}...")
+                index.create(bind=db.engine, checkfirst=True)
+        
+        print("Index migration completed successfully!")
+
+if __name__ == "__main__":
+    migrate_indexes()
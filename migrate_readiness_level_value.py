@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Database migration to add the denormalized readiness_level_value column to readiness_assessments
+"""
+from app import app, db, READINESS_LEVEL_VALUE_TRIGGERS
+from sqlalchemy import text, inspect
+
+def migrate_readiness_level_value():
+    """Add, backfill and index readiness_level_value and install the triggers that maintain it"""
+    with app.app_context():
+        inspector = inspect(db.engine)
+        columns = [col['name'] for col in inspector.get_columns('readiness_assessments')]
+        
+        try:
+            with db.engine.begin() as connection:
+                if 'readiness_level_value' in columns:
+                    print("readiness_level_value column already exists in readiness_assessments table")
+                else:
+                    print("Adding readiness_level_value column to readiness_assessments table...")
+                    connection.execute(text('ALTER TABLE readiness_assessments ADD COLUMN readiness_level_value SMALLINT'))
+                
+                print("Backfilling readiness_level_value from technical_readiness_levels...")
+                connection.execute(text(
+                    'UPDATE readiness_assessments SET readiness_level_value = '
+                    '(SELECT level FROM technical_readiness_levels WHERE id = readiness_assessments.readiness_level_id)'
+                ))
+                
+                print("Creating triggers to keep readiness_level_value in sync...")
+                for trigger_sql in READINESS_LEVEL_VALUE_TRIGGERS:
+                    connection.execute(text(trigger_sql))
+                
+                print("Creating index on readiness_level_value...")
+                connection.execute(text(
+                    'CREATE INDEX IF NOT EXISTS ix_readiness_assessments_readiness_level_value '
+                    'ON readiness_assessments (readiness_level_value)'
+                ))
+            
+            print("Database migration completed successfully!")
+        
+        except Exception as e:
+            print(f"Error during migration: {e}")
+            raise
+
+if __name__ == "__main__":
+    migrate_readiness_level_value()
\ No newline at end of file
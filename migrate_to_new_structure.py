@@ -10,12 +10,29 @@ This script will:
 4. Initialize sample data
 """
 
-from app import app, db, ProductFeature, Capabilities, TechnicalFunction
+from app import app, db, ProductFeature, Capabilities, TechnicalFunction, capability_technical_functions
+from sqlalchemy import insert, text
 import json
+import sys
 from datetime import datetime
 
 def backup_existing_data():
-    """Backup existing data before migration"""
+    """Snapshot the SQLite database file before migration using VACUUM INTO"""
+    print("📦 Backing up existing database...")
+    
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    backup_filename = f'data_backup_{timestamp}.db'
+    
+    with app.app_context():
+        # VACUUM cannot run inside a transaction, so use an autocommit connection
+        with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM INTO :filename"), {"filename": backup_filename})
+    
+    print(f"✅ Database backed up to {backup_filename}")
+    return backup_filename
+
+def backup_existing_data_json():
+    """Backup existing data as human-readable JSON before migration"""
     print("📦 Backing up existing data...")
     
     with app.app_context():
@@ -214,22 +231,29 @@ def create_demo_data_with_new_structure():
         # Create capability name to object mapping
         cap_map = {cap.name: cap for cap in created_capabilities}
         
-        for tf_data in technical_functions_data:
-            tech_func = TechnicalFunction(
+        created_technical_functions = [
+            TechnicalFunction(
                 name=tf_data["name"],
                 description=tf_data["description"],
                 success_criteria=tf_data["success_criteria"],
                 tmos=f"Technical implementation of {tf_data['name']}",
                 status_relative_to_tmos=50.0  # Default progress
             )
-            
-            db.session.add(tech_func)
-            db.session.flush()  # Get ID
-            
-            # Link to capabilities
-            for cap_name in tf_data["capabilities"]:
-                if cap_name in cap_map:
-                    tech_func.capabilities.append(cap_map[cap_name])
+            for tf_data in technical_functions_data
+        ]
+        
+        db.session.add_all(created_technical_functions)
+        db.session.flush()  # Get all technical function IDs in one flush
+        
+        # Link to capabilities with a single multi-row insert
+        link_rows = [
+            {"capability_id": cap_map[cap_name].id, "technical_function_id": tech_func.id}
+            for tech_func, tf_data in zip(created_technical_functions, technical_functions_data)
+            for cap_name in tf_data["capabilities"]
+            if cap_name in cap_map
+        ]
+        if link_rows:
+            db.session.execute(insert(capability_technical_functions), link_rows)
         
         db.session.commit()
         
@@ -241,8 +265,11 @@ def main():
     print("🚀 Starting migration to new database structure...")
     print("=" * 60)
     
-    # Step 1: Backup existing data
-    backup_data = backup_existing_data()
+    # Step 1: Backup existing data (pass --json for a human-readable backup)
+    if '--json' in sys.argv:
+        backup_existing_data_json()
+    else:
+        backup_existing_data()
     
     # Step 2: Recreate database with new structure
     recreate_database()
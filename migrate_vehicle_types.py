@@ -3,9 +3,17 @@
 Migration script to convert vehicle_type string fields to vehicle_platform_id foreign keys
 """
 
-from app import app, db, ProductFeature, TechnicalFunction, Capabilities, VehiclePlatform
+from app import app, db, VehiclePlatform
 from sqlalchemy import text
 
+# Statements used by the data migration steps below
+SELECT_PF_VEHICLE_TYPES = text("SELECT id, name, vehicle_type FROM product_features")
+SELECT_TF_VEHICLE_TYPES = text("SELECT id, name, vehicle_type FROM technical_functions")
+SELECT_CAP_VEHICLE_TYPES = text("SELECT id, name, vehicle_type FROM capabilities")
+UPDATE_PF_PLATFORM = text("UPDATE product_features SET vehicle_platform_id = :platform_id WHERE id = :id")
+UPDATE_TF_PLATFORM = text("UPDATE technical_functions SET vehicle_platform_id = :platform_id WHERE id = :id")
+UPDATE_CAP_PLATFORM = text("UPDATE capabilities SET vehicle_platform_id = :platform_id WHERE id = :id")
+
 def migrate_vehicle_types():
     """Migrate from vehicle_type strings to vehicle_platform_id foreign keys"""
     
@@ -76,60 +84,57 @@ def migrate_vehicle_types():
         
         # Step 3: Migrate data for ProductFeatures
         print("📊 Migrating ProductFeature data...")
-        product_features = ProductFeature.query.all()
+        product_features = db.session.execute(SELECT_PF_VEHICLE_TYPES).all()
         
+        updated_count = 0
         for pf in product_features:
             try:
-                # Get the old vehicle_type value
-                old_type = db.session.execute(text("SELECT vehicle_type FROM product_features WHERE id = :id"), {"id": pf.id}).fetchone()
-                if old_type and old_type[0]:
-                    vehicle_type = old_type[0]
+                vehicle_type = pf.vehicle_type
+                if vehicle_type:
                     platform = platform_mapping.get(vehicle_type, platform_mapping['generic'])
                     
                     # Update with new foreign key
-                    db.session.execute(text("UPDATE product_features SET vehicle_platform_id = :platform_id WHERE id = :id"), 
-                                     {"platform_id": platform.id, "id": pf.id})
-                    print(f"  ✅ Updated ProductFeature '{pf.name}': {vehicle_type} -> {platform.name}")
+                    db.session.execute(UPDATE_PF_PLATFORM, {"platform_id": platform.id, "id": pf.id})
+                    updated_count += 1
             except Exception as e:
                 print(f"  ⚠️  Error migrating ProductFeature {pf.name}: {e}")
+        print(f"  ✅ Updated {updated_count} ProductFeatures")
         
         # Step 4: Migrate data for TechnicalFunctions
         print("📊 Migrating TechnicalFunction data...")
-        technical_functions = TechnicalFunction.query.all()
+        technical_functions = db.session.execute(SELECT_TF_VEHICLE_TYPES).all()
         
+        updated_count = 0
         for tf in technical_functions:
             try:
-                # Get the old vehicle_type value
-                old_type = db.session.execute(text("SELECT vehicle_type FROM technical_functions WHERE id = :id"), {"id": tf.id}).fetchone()
-                if old_type and old_type[0]:
-                    vehicle_type = old_type[0]
+                vehicle_type = tf.vehicle_type
+                if vehicle_type:
                     platform = platform_mapping.get(vehicle_type, platform_mapping['generic'])
                     
                     # Update with new foreign key
-                    db.session.execute(text("UPDATE technical_functions SET vehicle_platform_id = :platform_id WHERE id = :id"), 
-                                     {"platform_id": platform.id, "id": tf.id})
-                    print(f"  ✅ Updated TechnicalFunction '{tf.name}': {vehicle_type} -> {platform.name}")
+                    db.session.execute(UPDATE_TF_PLATFORM, {"platform_id": platform.id, "id": tf.id})
+                    updated_count += 1
             except Exception as e:
                 print(f"  ⚠️  Error migrating TechnicalFunction {tf.name}: {e}")
+        print(f"  ✅ Updated {updated_count} TechnicalFunctions")
         
         # Step 5: Migrate data for Capabilities
         print("📊 Migrating Capabilities data...")
-        capabilities = Capabilities.query.all()
+        capabilities = db.session.execute(SELECT_CAP_VEHICLE_TYPES).all()
         
+        updated_count = 0
         for cap in capabilities:
             try:
-                # Get the old vehicle_type value
-                old_type = db.session.execute(text("SELECT vehicle_type FROM capabilities WHERE id = :id"), {"id": cap.id}).fetchone()
-                if old_type and old_type[0]:
-                    vehicle_type = old_type[0]
+                vehicle_type = cap.vehicle_type
+                if vehicle_type:
                     platform = platform_mapping.get(vehicle_type, platform_mapping['generic'])
                     
                     # Update with new foreign key
-                    db.session.execute(text("UPDATE capabilities SET vehicle_platform_id = :platform_id WHERE id = :id"), 
-                                     {"platform_id": platform.id, "id": cap.id})
-                    print(f"  ✅ Updated Capability '{cap.name}': {vehicle_type} -> {platform.name}")
+                    db.session.execute(UPDATE_CAP_PLATFORM, {"platform_id": platform.id, "id": cap.id})
+                    updated_count += 1
             except Exception as e:
                 print(f"  ⚠️  Error migrating Capability {cap.name}: {e}")
+        print(f"  ✅ Updated {updated_count} Capabilities")
         
         db.session.commit()
         
@@ -10,6 +10,7 @@ This script will drop all tables and recreate them with the updated schema.
 """
 
 import os
+from sqlalchemy import text
 from app import app, db
 from sample_data import initialize_sample_data
 
@@ -17,7 +18,12 @@ def reset_database(with_sample_data=False):
     """Drop all tables and recreate with updated schema"""
     with app.app_context():
         print("Dropping all existing tables...")
-        db.drop_all()
+        # Drop tables directly rather than via db.drop_all() so no FK graph
+        # sort is needed; foreign keys are disabled so order does not matter
+        db.session.execute(text("PRAGMA foreign_keys=OFF"))
+        for table in db.metadata.tables.values():
+            db.session.execute(text(f'DROP TABLE IF EXISTS "{table.name}"'))
+        db.session.commit()
         
         print("Creating tables with updated schema...")
         db.create_all()
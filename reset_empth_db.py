@@ -1,9 +1,13 @@
+from sqlalchemy import text
 from app import app, db
 
 def reset_empty_database():
     """Reset database to empty state without sample data"""
     with app.app_context():
-        db.drop_all()
+        db.session.execute(text("PRAGMA foreign_keys=OFF"))
+        for table in db.metadata.tables.values():
+            db.session.execute(text(f'DROP TABLE IF EXISTS "{table.name}"'))
+        db.session.commit()
         db.create_all()
         print("Database reset to empty state!")
 
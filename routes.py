@@ -1,70 +1,197 @@
-from flask import render_template, request, redirect, url_for, flash, jsonify, send_file
-from app import app, db, ProductFeature, TechnicalFunction, TechnicalReadinessLevel, VehiclePlatform, ODD, Environment, Trailer, ReadinessAssessment, Capabilities, capability_technical_functions, product_feature_capabilities
-from sqlalchemy import and_
-from sqlalchemy.orm import joinedload
-from datetime import datetime, date
+from flask import render_template, stream_template, stream_with_context, request, redirect, url_for, flash, jsonify, send_file
+from app import app, db, cache, ProductFeature, TechnicalFunction, TechnicalReadinessLevel, VehiclePlatform, ODD, Environment, Trailer, ReadinessAssessment, Capabilities, capability_technical_functions, product_feature_capabilities
+from sqlalchemy import case, insert, lambda_stmt, literal, null, select
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
+from collections import defaultdict
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+import csv
+import io
 import json
 import os
+import orjson
+import shutil
+
+# Number of rows shown per page on paginated list views
+PER_PAGE = 50
+
+# Cache key for the /api/readiness_data response, cleared when assessments change
+READINESS_API_CACHE_KEY = 'readiness_api'
+
+# Cached lookup lists for dropdowns and configuration pages.
+# These tables change rarely; the add/delete routes drop the cached copy.
+# The cache pickles its values, so the lookups hold plain dicts of the rendered columns
+# rather than ORM instances, which would come back detached from any session.
+def lookup_rows(statement):
+    """Run a lookup query and return its rows as plain dicts"""
+    return [row._asdict() for row in db.session.execute(statement)]
+
+@cache.memoize(timeout=300)
+def get_vehicle_platforms():
+    """Get all vehicle platforms"""
+    return lookup_rows(select(VehiclePlatform.id, VehiclePlatform.name, VehiclePlatform.vehicle_type,
+                              VehiclePlatform.description, VehiclePlatform.max_payload))
+
+@cache.memoize(timeout=300)
+def get_odds():
+    """Get all ODDs"""
+    return lookup_rows(select(ODD.id, ODD.name, ODD.description, ODD.direction, ODD.lanes,
+                              ODD.max_speed, ODD.traction))
+
+@cache.memoize(timeout=300)
+def get_environments():
+    """Get all environments"""
+    return lookup_rows(select(Environment.id, Environment.name, Environment.description,
+                              Environment.climate, Environment.region, Environment.terrain))
+
+@cache.memoize(timeout=300)
+def get_trailers():
+    """Get all trailers"""
+    return lookup_rows(select(Trailer.id, Trailer.name, Trailer.description, Trailer.trailer_type,
+                              Trailer.axle_count, Trailer.length, Trailer.max_weight))
+
+@cache.memoize(timeout=300)
+def get_readiness_levels():
+    """Get all technical readiness levels ordered by level"""
+    return lookup_rows(select(TechnicalReadinessLevel.id, TechnicalReadinessLevel.level, TechnicalReadinessLevel.name,
+                              TechnicalReadinessLevel.description).order_by(TechnicalReadinessLevel.level))
+
+@cache.memoize(timeout=300)
+def get_product_features():
+    """Get all product features"""
+    return lookup_rows(select(ProductFeature.id, ProductFeature.name, ProductFeature.label))
+
+@cache.memoize(timeout=300)
+def get_technical_functions():
+    """Get all technical functions with their vehicle platform name"""
+    return lookup_rows(select(TechnicalFunction.id, TechnicalFunction.name,
+                              VehiclePlatform.name.label('vehicle_platform_name'))
+                       .outerjoin(TechnicalFunction.vehicle_platform))
+
+def clear_readiness_caches():
+    """Drop the cached dashboard, readiness matrix, timelines and readiness API data"""
+    cache.delete(READINESS_API_CACHE_KEY)
+    cache.delete_memoized(get_dashboard_data)
+    cache.delete_memoized(get_readiness_matrix)
+    for get_timeline in TIMELINE_BUILDERS.values():
+        cache.delete_memoized(get_timeline)
+
+CONFIG_LOOKUPS = {
+    'vehicle_platform': get_vehicle_platforms,
+    'odd': get_odds,
+    'environment': get_environments,
+    'trailer': get_trailers
+}
+
+# Read-only views answered with an ETag so repeat requests for an unchanged page get 304 Not Modified
+CONDITIONAL_GET_ENDPOINTS = {'dashboard', 'product_features', 'technical_functions', 'configurations', 'readiness_matrix', 'api_readiness_data', 'api_timeline_data'}
+
+@app.after_request
+def add_conditional_get_headers(response):
+    """Tag read-only GET responses with an ETag and honour If-None-Match"""
+    # Streamed pages have no body to hash up front, so they are sent as-is
+    if request.method != 'GET' or request.endpoint not in CONDITIONAL_GET_ENDPOINTS or response.status_code != 200 or response.is_streamed:
+        return response
+    # Weak, so Flask-Compress leaves the tag alone and compressed copies revalidate here
+    response.add_etag(weak=True)
+    # Always revalidate: forms redirect back to these pages right after a write
+    response.headers.setdefault('Cache-Control', 'private, max-age=0, must-revalidate')
+    return response.make_conditional(request)
 
 # Helper functions for export
-def get_status_color(status):
-    """Get hex color code for status"""
-    colors = {
-        "green": "#4CAF50",
-        "yellow": "#FFC107", 
-        "red": "#F44336"
-    }
-    return colors.get(status, "#9E9E9E")
+def export_load_options(*options):
+    """Eager-load options for export queries; in debug and testing any other relationship access raises"""
+    if app.debug or app.testing:
+        return options + (raiseload('*'),)
+    return options
 
-def calculate_timeline_position(assessment):
-    """Calculate timeline position based on dates"""
-    now = date.today()
-    
-    if assessment.scheduled_completion_date:
+def parse_date(value):
+    """Parse a YYYY-MM-DD date string from a form or JSON payload; empty values give None"""
+    return date.fromisoformat(value) if value else None
+
+def link_to_existing(table, owner_column, owner_id, target_column, target_model, target_ids):
+    """Link a new row to existing targets in one INSERT ... SELECT, skipping ids that do not exist"""
+    db.session.execute(insert(table).from_select(
+        [owner_column, target_column],
+        select(literal(owner_id), target_model.id).where(target_model.id.in_(target_ids))
+    ))
+
+# Hex color code for each assessment status, used inline in the export loops
+STATUS_COLORS = {
+    "green": "#4CAF50",
+    "yellow": "#FFC107", 
+    "red": "#F44336"
+}
+DEFAULT_STATUS_COLOR = "#9E9E9E"
+
+# Bootstrap color for a 0-100 progress score, indexed by the clamped whole-number score:
+# below 50 is danger, 50-79 warning, 80 and above success
+PROGRESS_COLORS = ['danger'] * 50 + ['warning'] * 30 + ['success'] * 21
+
+# Roadmap quarter for each TRL level (index 0 unused): higher TRLs land earlier
+TRL_QUARTERS = (None, 4, 4, 3, 3, 2, 2, 1, 1, 1)
+
+# Last day of the final month of each quarter (Mar, Jun, Sep, Dec) - never affected by leap years
+QUARTER_END_DAYS = (31, 30, 30, 31)
+
+# Memoized across calls: results are shared between identical inputs, so callers must not modify them
+@lru_cache(maxsize=1024)
+def calculate_timeline_position(scheduled_completion_date, level, today):
+    """Calculate timeline position from the completion date or TRL level as of today"""
+    if scheduled_completion_date:
         # Position based on scheduled completion
-        days_from_now = (assessment.scheduled_completion_date - now).days
-        quarter = min(4, max(1, (days_from_now // 90) + 1))
+        days_from_now = (scheduled_completion_date - today).days
+        quarter = 1 + max(0, min(3, days_from_now // 90))
         return {
             "quarter": quarter,
             "relative_position": (days_from_now % 90) / 90.0,
-            "date": assessment.scheduled_completion_date.isoformat()
+            "date": scheduled_completion_date.isoformat()
         }
     else:
-        # Position based on current TRL level (earlier for lower TRL)
-        trl_quarter_mapping = {
-            1: 4, 2: 4, 3: 3,  # Research phase - future quarters
-            4: 3, 5: 2, 6: 2,  # Development phase - mid-term
-            7: 1, 8: 1, 9: 1   # Deployment phase - near-term
-        }
-        quarter = trl_quarter_mapping.get(assessment.readiness_level.level, 2)
+        # Position based on current TRL level (earlier for higher TRL); unknown levels default to Q2
+        quarter = TRL_QUARTERS[level] if 1 <= level <= 9 else 2
         return {
             "quarter": quarter,
             "relative_position": 0.5,
             "date": None
         }
 
+def get_timeline_bounds(model):
+    """Get the earliest and latest planned start/end date of a model in a single aggregate query"""
+    min_start, min_end, max_start, max_end = db.session.query(
+        db.func.min(model.planned_start_date),
+        db.func.min(model.planned_end_date),
+        db.func.max(model.planned_start_date),
+        db.func.max(model.planned_end_date)
+    ).one()
+    
+    # Aggregates skip NULLs, so a bound is only missing when the whole column is empty
+    earliest = [d for d in (min_start, min_end) if d]
+    latest = [d for d in (max_start, max_end) if d]
+    return (min(earliest), max(latest)) if earliest else (None, None)
+
 def generate_quarters():
     """Generate next 4 quarters from current date"""
-    from datetime import datetime, timedelta
-    import calendar
-    
-    quarters = []
-    current_date = datetime.now()
+    today = date.today()
     
     # Determine current quarter
-    current_quarter = (current_date.month - 1) // 3 + 1
-    current_year = current_date.year
+    return generate_quarters_from(today.year, (today.month - 1) // 3 + 1)
+
+# Memoized per starting quarter, so the list is shared between exports and must not be modified
+@lru_cache(maxsize=4)
+def generate_quarters_from(current_year, current_quarter):
+    """Generate 4 quarters starting at the given year and quarter"""
+    quarters = []
     
     for i in range(4):
         quarter_num = ((current_quarter - 1 + i) % 4) + 1
         year = current_year + ((current_quarter - 1 + i) // 4)
         
         # Calculate quarter start and end dates
-        start_month = (quarter_num - 1) * 3 + 1
         end_month = quarter_num * 3
         
-        start_date = datetime(year, start_month, 1)
-        end_date = datetime(year, end_month, calendar.monthrange(year, end_month)[1])
+        start_date = datetime(year, end_month - 2, 1)
+        end_date = datetime(year, end_month, QUARTER_END_DAYS[quarter_num - 1])
         
         quarters.append({
             "id": f"Q{quarter_num}_{year}",
@@ -81,18 +208,16 @@ def generate_milestones(assessments):
     """Generate milestones from assessment completion dates"""
     milestones = []
     
-    # Group by completion dates
-    completion_dates = {}
+    # Group by completion dates in one pass over the already loaded assessments
+    completion_dates = defaultdict(list)
     for assessment in assessments:
         if assessment.scheduled_completion_date:
-            date_key = assessment.scheduled_completion_date.isoformat()
-            if date_key not in completion_dates:
-                completion_dates[date_key] = []
-            completion_dates[date_key].append(assessment)
+            completion_dates[assessment.scheduled_completion_date].append(assessment)
     
-    # Create milestones
-    for date_str, date_assessments in completion_dates.items():
+    # Create milestones in date order, formatting only the dates that become milestones
+    for completion_date, date_assessments in sorted(completion_dates.items()):
         if len(date_assessments) >= 2:  # Only create milestone if multiple items complete
+            date_str = completion_date.isoformat()
             milestone = {
                 "id": f"milestone_{date_str}",
                 "title": f"Milestone: {len(date_assessments)} capabilities complete",
@@ -108,27 +233,57 @@ def generate_milestones(assessments):
             }
             milestones.append(milestone)
     
-    return sorted(milestones, key=lambda x: x["date"])
+    return milestones
 
-@app.route('/')
-def dashboard():
-    """Main dashboard showing product feature readiness overview"""
-    # Get all product features with their technical capabilities and readiness levels
-    product_features = ProductFeature.query.all()
+# Dashboard data is cached rather than the page, so flashed messages are rendered per request
+@cache.memoize(timeout=60)
+def get_dashboard_data():
+    """Get the product feature overview and readiness statistics shown on the dashboard"""
+    # Get all product features with their capabilities, technical functions and readiness levels,
+    # loading only the columns the overview renders
+    product_features = ProductFeature.query.options(
+        load_only(ProductFeature.name, ProductFeature.description),
+        selectinload(ProductFeature.capabilities).load_only(Capabilities.name)
+        .selectinload(Capabilities.technical_functions).load_only(TechnicalFunction.name)
+        .selectinload(TechnicalFunction.readiness_assessments).load_only(ReadinessAssessment.readiness_level_id)
+        .joinedload(ReadinessAssessment.readiness_level).load_only(TechnicalReadinessLevel.level)
+    ).all()
     
-    # Get readiness statistics
-    total_assessments = ReadinessAssessment.query.count()
-    high_readiness = ReadinessAssessment.query.join(TechnicalReadinessLevel).filter(TechnicalReadinessLevel.level >= 7).count()
-    medium_readiness = ReadinessAssessment.query.join(TechnicalReadinessLevel).filter(and_(TechnicalReadinessLevel.level >= 4, TechnicalReadinessLevel.level < 7)).count()
-    low_readiness = ReadinessAssessment.query.join(TechnicalReadinessLevel).filter(TechnicalReadinessLevel.level < 4).count()
+    # The cache pickles the result, so hand back plain dicts of the rendered fields rather than ORM instances
+    product_features = [{
+        'name': product_feature.name,
+        'description': product_feature.description,
+        'capabilities': [{
+            'name': capability.name,
+            'technical_functions': [{
+                'name': technical_function.name,
+                'trl_levels': [assessment.readiness_level.level for assessment in technical_function.readiness_assessments]
+            } for technical_function in capability.technical_functions]
+        } for capability in product_feature.capabilities]
+    } for product_feature in product_features]
+    
+    # Get readiness statistics - total and TRL buckets in a single aggregate query,
+    # using the denormalized level so no join to the TRL table is needed
+    total_assessments, high_readiness, medium_readiness, low_readiness = db.session.query(
+        db.func.count(ReadinessAssessment.id),
+        db.func.sum(case((ReadinessAssessment.readiness_level_value >= 7, 1), else_=0)),
+        db.func.sum(case((ReadinessAssessment.readiness_level_value.between(4, 6), 1), else_=0)),
+        db.func.sum(case((ReadinessAssessment.readiness_level_value < 4, 1), else_=0))
+    ).one()
     
     readiness_stats = {
         'total': total_assessments,
-        'high': high_readiness,
-        'medium': medium_readiness,
-        'low': low_readiness
+        'high': high_readiness or 0,
+        'medium': medium_readiness or 0,
+        'low': low_readiness or 0
     }
     
+    return product_features, readiness_stats
+
+@app.route('/')
+def dashboard():
+    """Main dashboard showing product feature readiness overview"""
+    product_features, readiness_stats = get_dashboard_data()
     return render_template('dashboard.html', 
                          product_features=product_features,
                          readiness_stats=readiness_stats)
@@ -136,17 +291,13 @@ def dashboard():
 @app.route('/product_features')
 def product_features():
     """View all product features with eager loading to prevent N+1 queries"""
-    from sqlalchemy.orm import joinedload
-    
-    features = ProductFeature.query.options(
+    pagination = ProductFeature.query.options(
         joinedload(ProductFeature.vehicle_platform),
-        joinedload(ProductFeature.capabilities)
-        .joinedload(Capabilities.technical_functions)
-        .joinedload(TechnicalFunction.readiness_assessments)
-        .joinedload(ReadinessAssessment.readiness_level)
-    ).all()
+        # The page only lists capability names and labels, so nothing below them is loaded
+        selectinload(ProductFeature.capabilities).load_only(Capabilities.name, Capabilities.label)
+    ).order_by(ProductFeature.id).paginate(page=request.args.get('page', 1, type=int), per_page=PER_PAGE, error_out=False)
     
-    return render_template('product_features.html', features=features)
+    return render_template('product_features.html', features=pagination.items, pagination=pagination)
 
 @app.route('/capabilities')
 def capabilities():
@@ -170,78 +321,128 @@ def readiness_assessments():
     platform_id = request.args.get('platform_id', type=int)
     min_trl = request.args.get('min_trl', type=int)
     
-    # Build query with filters
-    query = ReadinessAssessment.query
+    # Build query with filters, eager-loading everything the template renders per row
+    query = ReadinessAssessment.query.options(
+        selectinload(ReadinessAssessment.technical_function).selectinload(TechnicalFunction.capabilities),
+        selectinload(ReadinessAssessment.capability),
+        selectinload(ReadinessAssessment.readiness_level),
+        selectinload(ReadinessAssessment.vehicle_platform),
+        selectinload(ReadinessAssessment.odd),
+        selectinload(ReadinessAssessment.environment),
+        selectinload(ReadinessAssessment.trailer)
+    )
     
+    # Every filter is a plain WHERE predicate (no joins), so each filter combination
+    # compiles to one stable statement shape that SQLAlchemy's statement cache reuses
     if product_id:
-        query = query.join(TechnicalFunction).filter(TechnicalFunction.product_feature_id == product_id)
+        # Technical functions reach product features through their capabilities
+        product_technical_ids = select(capability_technical_functions.c.technical_function_id).join(
+            product_feature_capabilities,
+            product_feature_capabilities.c.capability_id == capability_technical_functions.c.capability_id
+        ).where(product_feature_capabilities.c.product_feature_id == product_id)
+        query = query.filter(ReadinessAssessment.technical_capability_id.in_(product_technical_ids))
     if technical_id:
         query = query.filter(ReadinessAssessment.technical_capability_id == technical_id)
     if platform_id:
         query = query.filter(ReadinessAssessment.vehicle_platform_id == platform_id)
     if min_trl:
-        query = query.join(TechnicalReadinessLevel).filter(TechnicalReadinessLevel.level >= min_trl)
+        query = query.filter(ReadinessAssessment.readiness_level_value >= min_trl)
     
-    assessments = query.all()
+    pagination = query.order_by(ReadinessAssessment.id).paginate(
+        page=request.args.get('page', 1, type=int), per_page=PER_PAGE, error_out=False
+    )
     
     # Get data for filter dropdowns
-    product_features = ProductFeature.query.all()
-    technical_functions = TechnicalFunction.query.all()
-    vehicle_platforms = VehiclePlatform.query.all()
+    product_features = get_product_features()
+    technical_functions = get_technical_functions()
+    vehicle_platforms = get_vehicle_platforms()
     
     return render_template('readiness_assessments.html', 
-                         assessments=assessments,
+                         assessments=pagination.items,
+                         pagination=pagination,
                          product_features=product_features,
                          technical_functions=technical_functions,
                          vehicle_platforms=vehicle_platforms)
 
-@app.route('/readiness_matrix')
-def readiness_matrix():
-    """Display readiness matrix view"""
-    # Get all readiness assessments with their related data
-    assessments = ReadinessAssessment.query.options(
-        joinedload(ReadinessAssessment.capability),
-        joinedload(ReadinessAssessment.technical_function),
-        joinedload(ReadinessAssessment.readiness_level),
-        joinedload(ReadinessAssessment.vehicle_platform),
-        joinedload(ReadinessAssessment.odd),
-        joinedload(ReadinessAssessment.environment)
-    ).all()
+# Matrix rows are cached rather than the page, since the page itself is streamed
+@cache.memoize(timeout=60)
+def get_readiness_matrix():
+    """Get the readiness matrix rows and their TRL summary"""
+    # Build the flat matrix rows in SQL and stream them as plain column tuples in batches of 500,
+    # instead of hydrating an assessment plus six related objects per row.
+    # Inner joins on the required relationships drop incomplete assessments in SQL.
+    rows = db.session.execute(
+        select(
+            ReadinessAssessment.id,
+            TechnicalFunction.name.label('technical_function_name'),
+            Capabilities.id.label('capability_id'),
+            Capabilities.label.label('capability_label'),
+            VehiclePlatform.name.label('vehicle_platform'),
+            ODD.name.label('odd'),
+            Environment.name.label('environment'),
+            TechnicalReadinessLevel.level.label('trl_level'),
+            TechnicalReadinessLevel.name.label('trl_name'),
+            ReadinessAssessment.current_status,
+            ReadinessAssessment.assessment_date
+        )
+        .join(ReadinessAssessment.readiness_level)
+        .join(ReadinessAssessment.vehicle_platform)
+        .join(ReadinessAssessment.odd)
+        .join(ReadinessAssessment.environment)
+        .outerjoin(ReadinessAssessment.technical_function)
+        .outerjoin(ReadinessAssessment.capability)
+        .execution_options(yield_per=500)
+    )
     
-    # Create matrix data from existing assessments
+    # Create matrix data from existing assessments, tallying the summary in the same pass
     matrix_data = []
-    for assessment in assessments:
+    matrix_stats = {'total': 0, 'high': 0, 'medium': 0, 'low': 0}
+    for row in rows:
         # Determine the technical function name - try technical_function first, then capability
-        if assessment.technical_function:
-            technical_function_name = assessment.technical_function.name
-        elif assessment.capability:
-            technical_function_name = assessment.capability.label
+        if row.technical_function_name is not None:
+            technical_function_name = row.technical_function_name
+        elif row.capability_id is not None:
+            technical_function_name = row.capability_label
         else:
-            technical_function_name = f"Assessment #{assessment.id}"
-        
-        # Only add if we have the required relationships
-        if assessment.readiness_level and assessment.vehicle_platform and assessment.odd and assessment.environment:
-            matrix_data.append({
-                'technical_function': technical_function_name,
-                'vehicle_platform': assessment.vehicle_platform.name,
-                'odd': assessment.odd.name,
-                'environment': assessment.environment.name,
-                'trl_level': assessment.readiness_level.level,
-                'trl_name': assessment.readiness_level.name,
-                'confidence': assessment.current_status or 'medium',  # Default to medium if not set
-                'assessment_date': assessment.assessment_date
-            })
+            technical_function_name = f"Assessment #{row.id}"
+        
+        matrix_data.append({
+            'technical_function': technical_function_name,
+            'vehicle_platform': row.vehicle_platform,
+            'odd': row.odd,
+            'environment': row.environment,
+            'trl_level': row.trl_level,
+            'trl_name': row.trl_name,
+            'confidence': row.current_status or 'medium',  # Default to medium if not set
+            'assessment_date': row.assessment_date
+        })
+        
+        matrix_stats['total'] += 1
+        if row.trl_level >= 7:
+            matrix_stats['high'] += 1
+        elif row.trl_level >= 4:
+            matrix_stats['medium'] += 1
+        else:
+            matrix_stats['low'] += 1
     
-    return render_template('readiness_matrix.html', matrix_data=matrix_data)
+    return matrix_data, matrix_stats
+
+@app.route('/readiness_matrix')
+def readiness_matrix():
+    """Display readiness matrix view"""
+    matrix_data, matrix_stats = get_readiness_matrix()
+    
+    # Stream the rendered page so large matrices start reaching the browser early
+    return stream_template('readiness_matrix.html', matrix_data=matrix_data, matrix_stats=matrix_stats)
 
 @app.route('/configurations')
 def configurations():
     """View and manage system configurations"""
-    vehicle_platforms = VehiclePlatform.query.all()
-    odds = ODD.query.all()
-    environments = Environment.query.all()
-    trailers = Trailer.query.all()
-    readiness_levels = TechnicalReadinessLevel.query.order_by(TechnicalReadinessLevel.level).all()
+    vehicle_platforms = get_vehicle_platforms()
+    odds = get_odds()
+    environments = get_environments()
+    trailers = get_trailers()
+    readiness_levels = get_readiness_levels()
     
     return render_template('configurations.html',
                          vehicle_platforms=vehicle_platforms,
@@ -255,36 +456,35 @@ def add_assessment():
     """Add new readiness assessment"""
     if request.method == 'POST':
         # Handle scheduled_completion_date conversion
-        scheduled_completion_date = None
-        if request.form.get('scheduled_completion_date'):
-            from datetime import datetime
-            scheduled_completion_date = datetime.strptime(request.form['scheduled_completion_date'], '%Y-%m-%d').date()
-        
-        assessment = ReadinessAssessment(
-            capability_id=request.form['capability_id'],
-            readiness_level_id=request.form['readiness_level_id'],
-            vehicle_platform_id=request.form['vehicle_platform_id'],
-            odd_id=request.form['odd_id'],
-            environment_id=request.form['environment_id'],
-            trailer_id=request.form.get('trailer_id') or None,
+        scheduled_completion_date = parse_date(request.form.get('scheduled_completion_date'))
+        
+        # Core insert: the new row is not needed as an ORM object before redirecting
+        db.session.execute(insert(ReadinessAssessment).values(
+            capability_id=int(request.form['capability_id']),
+            readiness_level_id=int(request.form['readiness_level_id']),
+            vehicle_platform_id=int(request.form['vehicle_platform_id']),
+            odd_id=int(request.form['odd_id']),
+            environment_id=int(request.form['environment_id']),
+            trailer_id=request.form.get('trailer_id', type=int),
             assessor=request.form['assessor'],
             notes=request.form['notes'],
             current_status=request.form['current_status'],
             scheduled_completion_date=scheduled_completion_date
-        )
-        
-        db.session.add(assessment)
+        ))
         db.session.commit()
+        clear_readiness_caches()
         flash('Assessment added successfully!', 'success')
         return redirect(url_for('readiness_assessments'))
     
     # GET request - show form
-    capabilities = Capabilities.query.order_by(Capabilities.label).all()
-    readiness_levels = TechnicalReadinessLevel.query.order_by(TechnicalReadinessLevel.level).all()
-    vehicle_platforms = VehiclePlatform.query.all()
-    odds = ODD.query.all()
-    environments = Environment.query.all()
-    trailers = Trailer.query.all()
+    capabilities = Capabilities.query.options(
+        selectinload(Capabilities.product_features)
+    ).order_by(Capabilities.label).all()
+    readiness_levels = get_readiness_levels()
+    vehicle_platforms = get_vehicle_platforms()
+    odds = get_odds()
+    environments = get_environments()
+    trailers = get_trailers()
 
     return render_template('add_assessment.html',
                          capabilities=capabilities,
@@ -294,6 +494,50 @@ def add_assessment():
                          environments=environments,
                          trailers=trailers)
 
+@app.route('/bulk_add_assessment', methods=['POST'])
+def bulk_add_assessment():
+    """Add many readiness assessments from a JSON list in a single transaction"""
+    try:
+        # Bodies that are not JSON objects are rejected here rather than failing below with a 500
+        json_data = request.get_json(silent=True)
+        
+        if not isinstance(json_data, dict) or not isinstance(json_data.get('assessments'), list):
+            return jsonify({'error': 'Invalid JSON structure. Must contain an assessments array'}), 400
+        
+        mappings = []
+        for item in json_data['assessments']:
+            mappings.append({
+                'technical_capability_id': int(item['technical_capability_id']) if item.get('technical_capability_id') else None,
+                'capability_id': int(item['capability_id']) if item.get('capability_id') else None,
+                'readiness_level_id': int(item['readiness_level_id']),
+                'vehicle_platform_id': int(item['vehicle_platform_id']),
+                'odd_id': int(item['odd_id']),
+                'environment_id': int(item['environment_id']),
+                'trailer_id': int(item['trailer_id']) if item.get('trailer_id') else None,
+                'assessor': item.get('assessor'),
+                'notes': item.get('notes'),
+                'current_status': item.get('current_status'),
+                'scheduled_completion_date': parse_date(item.get('scheduled_completion_date'))
+            })
+        
+        # Batched executemany insert, bypassing per-object unit of work bookkeeping
+        db.session.bulk_insert_mappings(ReadinessAssessment, mappings)
+        db.session.commit()
+        clear_readiness_caches()
+        
+        return jsonify({
+            'success': True,
+            'message': f'Successfully added {len(mappings)} assessments',
+            'assessments_added': len(mappings)
+        })
+    
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        db.session.rollback()
+        return jsonify({'error': f'Invalid assessment data: {str(e)}'}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'Failed to add assessments: {str(e)}'}), 500
+
 @app.route('/delete_assessment/<int:assessment_id>', methods=['POST'])
 def delete_assessment(assessment_id):
     """Delete a readiness assessment"""
@@ -310,6 +554,7 @@ def delete_assessment(assessment_id):
         
         db.session.delete(assessment)
         db.session.commit()
+        clear_readiness_caches()
         
         flash(f'Successfully deleted assessment for "{item_name}"', 'success')
         
@@ -324,16 +569,8 @@ def add_product_feature():
     """Add new product feature"""
     if request.method == 'POST':
         # Handle date conversions
-        planned_start_date = None
-        planned_end_date = None
-        
-        if request.form.get('planned_start_date'):
-            from datetime import datetime
-            planned_start_date = datetime.strptime(request.form['planned_start_date'], '%Y-%m-%d').date()
-        
-        if request.form.get('planned_end_date'):
-            from datetime import datetime
-            planned_end_date = datetime.strptime(request.form['planned_end_date'], '%Y-%m-%d').date()
+        planned_start_date = parse_date(request.form.get('planned_start_date'))
+        planned_end_date = parse_date(request.form.get('planned_end_date'))
         
         # Handle status_relative_to_tmos conversion
         status_relative_to_tmos = 0.0
@@ -364,12 +601,12 @@ def add_product_feature():
             # Handle M:N relationship with capabilities
             capabilities_required = request.form.getlist('capabilities_required')
             if capabilities_required:
-                for capability_id in capabilities_required:
-                    capability = Capabilities.query.get(int(capability_id))
-                    if capability:
-                        product_feature.capabilities.append(capability)
+                link_to_existing(product_feature_capabilities, 'product_feature_id', product_feature.id,
+                                 'capability_id', Capabilities, [int(capability_id) for capability_id in capabilities_required])
             
             db.session.commit()
+            cache.delete_memoized(get_product_features)
+            clear_readiness_caches()
             flash('Product feature added successfully!', 'success')
             return redirect(url_for('product_features'))
         except Exception as e:
@@ -377,8 +614,8 @@ def add_product_feature():
             flash(f'Error adding product feature: {str(e)}', 'danger')
     
     # GET request - show form
-    vehicle_platforms = VehiclePlatform.query.all()
-    capabilities = Capabilities.query.all()
+    vehicle_platforms = get_vehicle_platforms()
+    capabilities = Capabilities.query.options(joinedload(Capabilities.vehicle_platform)).all()
     
     return render_template('add_product_feature.html',
                          vehicle_platforms=vehicle_platforms,
@@ -389,16 +626,8 @@ def add_capability():
     """Add new capability"""
     if request.method == 'POST':
         # Handle date conversions
-        planned_start_date = None
-        planned_end_date = None
-        
-        if request.form.get('planned_start_date'):
-            from datetime import datetime
-            planned_start_date = datetime.strptime(request.form['planned_start_date'], '%Y-%m-%d').date()
-        
-        if request.form.get('planned_end_date'):
-            from datetime import datetime
-            planned_end_date = datetime.strptime(request.form['planned_end_date'], '%Y-%m-%d').date()
+        planned_start_date = parse_date(request.form.get('planned_start_date'))
+        planned_end_date = parse_date(request.form.get('planned_end_date'))
         
         # Handle progress_relative_to_tmos conversion
         progress_relative_to_tmos = 0.0
@@ -426,16 +655,17 @@ def add_capability():
             # Add product feature relationships if specified
             product_feature_ids = request.form.getlist('product_feature_ids')
             if product_feature_ids:
-                product_features = ProductFeature.query.filter(ProductFeature.id.in_(product_feature_ids)).all()
-                capability.product_features.extend(product_features)
+                link_to_existing(product_feature_capabilities, 'capability_id', capability.id,
+                                 'product_feature_id', ProductFeature, product_feature_ids)
             
             # Add technical function dependencies if specified
             technical_function_ids = request.form.getlist('technical_function_ids')
             if technical_function_ids:
-                technical_functions = TechnicalFunction.query.filter(TechnicalFunction.id.in_(technical_function_ids)).all()
-                capability.technical_functions.extend(technical_functions)
+                link_to_existing(capability_technical_functions, 'capability_id', capability.id,
+                                 'technical_function_id', TechnicalFunction, technical_function_ids)
             
             db.session.commit()
+            clear_readiness_caches()
             flash('Capability added successfully!', 'success')
             return redirect(url_for('capabilities'))
         except Exception as e:
@@ -443,9 +673,9 @@ def add_capability():
             flash(f'Error adding capability: {str(e)}', 'danger')
     
     # GET request - show form
-    vehicle_platforms = VehiclePlatform.query.all()
-    product_features = ProductFeature.query.all()
-    technical_functions = TechnicalFunction.query.all()
+    vehicle_platforms = get_vehicle_platforms()
+    product_features = get_product_features()
+    technical_functions = get_technical_functions()
     
     return render_template('add_capability.html',
                          vehicle_platforms=vehicle_platforms,
@@ -457,16 +687,8 @@ def add_technical_function():
     """Add new technical function"""
     if request.method == 'POST':
         # Handle date conversions
-        planned_start_date = None
-        planned_end_date = None
-        
-        if request.form.get('planned_start_date'):
-            from datetime import datetime
-            planned_start_date = datetime.strptime(request.form['planned_start_date'], '%Y-%m-%d').date()
-        
-        if request.form.get('planned_end_date'):
-            from datetime import datetime
-            planned_end_date = datetime.strptime(request.form['planned_end_date'], '%Y-%m-%d').date()
+        planned_start_date = parse_date(request.form.get('planned_start_date'))
+        planned_end_date = parse_date(request.form.get('planned_end_date'))
         
         # Handle status_relative_to_tmos conversion
         status_relative_to_tmos = 0.0
@@ -495,10 +717,12 @@ def add_technical_function():
             # Add capability relationships if specified
             capability_ids = request.form.getlist('capability_ids')
             if capability_ids:
-                capabilities = Capabilities.query.filter(Capabilities.id.in_(capability_ids)).all()
-                technical_function.capabilities.extend(capabilities)
+                link_to_existing(capability_technical_functions, 'technical_function_id', technical_function.id,
+                                 'capability_id', Capabilities, capability_ids)
             
             db.session.commit()
+            cache.delete_memoized(get_technical_functions)
+            clear_readiness_caches()
             flash('Technical function added successfully!', 'success')
             return redirect(url_for('technical_functions'))
         except Exception as e:
@@ -506,7 +730,7 @@ def add_technical_function():
             flash(f'Error adding technical function: {str(e)}', 'danger')
     
     # GET request - show form
-    vehicle_platforms = VehiclePlatform.query.all()
+    vehicle_platforms = get_vehicle_platforms()
     capabilities = Capabilities.query.all()
     
     return render_template('add_technical_function.html',
@@ -514,47 +738,72 @@ def add_technical_function():
                          capabilities=capabilities)
 
 @app.route('/api/readiness_data')
+@cache.cached(timeout=60, key_prefix=READINESS_API_CACHE_KEY)
 def api_readiness_data():
     """API endpoint for readiness data (for charts/graphs)"""
-    # Get readiness distribution by TRL level
-    trl_distribution = db.session.query(
+    # Assessments with their TRL level, shared by both aggregates below
+    assessment_levels = db.session.query(
+        ReadinessAssessment.id.label('assessment_id'),
+        ReadinessAssessment.technical_capability_id,
         TechnicalReadinessLevel.level,
-        TechnicalReadinessLevel.name,
-        db.func.count(ReadinessAssessment.id).label('count')
-    ).join(ReadinessAssessment).group_by(TechnicalReadinessLevel.level).all()
+        TechnicalReadinessLevel.name
+    ).join(TechnicalReadinessLevel, ReadinessAssessment.readiness_level_id == TechnicalReadinessLevel.id)\
+     .cte('assessment_levels')
     
-    # Get readiness by product feature - use explicit joins with the many-to-many relationship
+    # Readiness distribution by TRL level
+    trl_distribution = db.session.query(
+        literal('trl').label('kind'),
+        assessment_levels.c.level,
+        assessment_levels.c.name,
+        db.func.count(assessment_levels.c.assessment_id).label('value')
+    ).group_by(assessment_levels.c.level)
+    
+    # Readiness by product feature - use explicit joins with the many-to-many relationship
+    # The average is cast to a float in SQL so the rows serialize as they are
     product_readiness = db.session.query(
+        literal('product').label('kind'),
+        null(),
         ProductFeature.name,
-        db.func.avg(TechnicalReadinessLevel.level).label('avg_trl')
+        db.cast(db.func.avg(assessment_levels.c.level), db.Float).label('value')
     ).select_from(ProductFeature)\
      .join(product_feature_capabilities, ProductFeature.id == product_feature_capabilities.c.product_feature_id)\
-     .join(Capabilities, Capabilities.id == product_feature_capabilities.c.capability_id)\
-     .join(capability_technical_functions, Capabilities.id == capability_technical_functions.c.capability_id)\
-     .join(TechnicalFunction, TechnicalFunction.id == capability_technical_functions.c.technical_function_id)\
-     .join(ReadinessAssessment, TechnicalFunction.id == ReadinessAssessment.technical_capability_id)\
-     .join(TechnicalReadinessLevel, ReadinessAssessment.readiness_level_id == TechnicalReadinessLevel.id)\
-     .group_by(ProductFeature.name).all()
-    
-    return jsonify({
-        'trl_distribution': [{'level': t.level, 'name': t.name, 'count': t.count} for t in trl_distribution],
-        'product_readiness': [{'name': p.name, 'avg_trl': float(p.avg_trl)} for p in product_readiness]
-    })
+     .join(capability_technical_functions, product_feature_capabilities.c.capability_id == capability_technical_functions.c.capability_id)\
+     .join(assessment_levels, capability_technical_functions.c.technical_function_id == assessment_levels.c.technical_capability_id)\
+     .group_by(ProductFeature.name)
+    
+    # Fetch both aggregates in a single round trip
+    rows = trl_distribution.union_all(product_readiness).all()
+    
+    return app.response_class(
+        response=orjson.dumps({
+            'trl_distribution': [{'level': r[1], 'name': r[2], 'count': r[3]} for r in rows if r[0] == 'trl'],
+            'product_readiness': [{'name': r[2], 'avg_trl': r[3]} for r in rows if r[0] == 'product']
+        }, option=orjson.OPT_SORT_KEYS),
+        status=200,
+        mimetype='application/json'
+    )
 
 @app.route('/export')
 def export_info():
     """Show export options and statistics"""
-    # Get statistics for display
-    total_assessments = ReadinessAssessment.query.count()
-    product_features_count = ProductFeature.query.count()
-    
-    # Status distribution
-    status_counts = {}
-    for status in ['green', 'yellow', 'red']:
-        status_counts[status] = ReadinessAssessment.query.filter_by(current_status=status).count()
+    # Get statistics for display - the product feature count rides along as a scalar
+    # subquery next to the assessment total, status distribution and completion dates
+    product_features_count, total_assessments, green_count, yellow_count, red_count, with_dates = db.session.query(
+        select(db.func.count(ProductFeature.id)).scalar_subquery(),
+        db.func.count(ReadinessAssessment.id),
+        db.func.sum(case((ReadinessAssessment.current_status == 'green', 1), else_=0)),
+        db.func.sum(case((ReadinessAssessment.current_status == 'yellow', 1), else_=0)),
+        db.func.sum(case((ReadinessAssessment.current_status == 'red', 1), else_=0)),
+        db.func.count(ReadinessAssessment.scheduled_completion_date)
+    ).one()
+    
+    status_counts = {
+        'green': green_count or 0,
+        'yellow': yellow_count or 0,
+        'red': red_count or 0
+    }
     
     # Completion date statistics
-    with_dates = ReadinessAssessment.query.filter(ReadinessAssessment.scheduled_completion_date.isnot(None)).count()
     without_dates = total_assessments - with_dates
     
     completion_stats = {
@@ -571,227 +820,255 @@ def export_info():
 @app.route('/export/miro_roadmap')
 def export_miro_roadmap():
     """Export assessment data in a format suitable for Miro roadmap visualization"""
-    from datetime import datetime, timedelta
-    import json
-    
-    # Get all assessments with related data
-    assessments = db.session.query(ReadinessAssessment).join(
-        TechnicalFunction
-    ).join(TechnicalReadinessLevel).all()
-    
-    # Create roadmap structure
-    roadmap_data = {
-        "meta": {
-            "export_date": datetime.now().isoformat(),
-            "total_assessments": len(assessments),
-            "title": "Product Feature Readiness Roadmap",
-            "description": "Technical readiness assessment roadmap for autonomous vehicle capabilities"
-        },
-        "timeline": {
-            "quarters": generate_quarters(),
-            "milestones": []
-        },
-        "swim_lanes": {},
-        "items": []
+    # Get all assessments with related data in a fixed number of queries;
+    # inner joins keep only assessments that have a technical function and TRL
+    # Only the columns the roadmap items read are fetched
+    assessments = ReadinessAssessment.query.options(*export_load_options(
+        load_only(ReadinessAssessment.notes, ReadinessAssessment.current_status, ReadinessAssessment.assessor,
+                  ReadinessAssessment.assessment_date, ReadinessAssessment.scheduled_completion_date),
+        joinedload(ReadinessAssessment.technical_function, innerjoin=True).options(
+            load_only(TechnicalFunction.name, TechnicalFunction.description, TechnicalFunction.document_url),
+            selectinload(TechnicalFunction.capabilities).options(
+                load_only(Capabilities.id),
+                selectinload(Capabilities.product_features).load_only(ProductFeature.name, ProductFeature.description, ProductFeature.document_url)
+            )
+        ),
+        joinedload(ReadinessAssessment.readiness_level, innerjoin=True).load_only(TechnicalReadinessLevel.level, TechnicalReadinessLevel.name),
+        joinedload(ReadinessAssessment.vehicle_platform).load_only(VehiclePlatform.name, VehiclePlatform.vehicle_type),
+        joinedload(ReadinessAssessment.odd).load_only(ODD.name),
+        joinedload(ReadinessAssessment.environment).load_only(Environment.name),
+        joinedload(ReadinessAssessment.trailer).load_only(Trailer.name)
+    )).all()
+    
+    meta = {
+        "export_date": datetime.now().isoformat(),
+        "total_assessments": len(assessments),
+        "title": "Product Feature Readiness Roadmap",
+        "description": "Technical readiness assessment roadmap for autonomous vehicle capabilities"
     }
     
-    # Group assessments by technical function (since we don't have direct product feature relationship)
-    for assessment in assessments:
-        tech_func = assessment.technical_function
+    def generate_roadmap():
+        # Stream the roadmap document, serializing each item as soon as it is built
+        # instead of holding every item and the whole encoded document in memory
+        yield b'{"meta":' + orjson.dumps(meta) + b',"items":['
         
-        # Find product features through capabilities
-        product_features = []
-        for capability in tech_func.capabilities:
-            for pf in capability.product_features:
-                if pf not in product_features:
-                    product_features.append(pf)
+        swim_lanes = {}
         
-        # Use the technical function as the swim lane if no product features found
-        if not product_features:
-            lane_name = f"Technical Function: {tech_func.name}"
-            lane_description = tech_func.description or ""
-            lane_doc_url = tech_func.document_url
-        else:
-            # Use the first product feature as the swim lane
-            pf = product_features[0]
-            lane_name = pf.name
-            lane_description = pf.description or ""
-            lane_doc_url = pf.document_url
-        
-        if lane_name not in roadmap_data["swim_lanes"]:
-            roadmap_data["swim_lanes"][lane_name] = {
-                "name": lane_name,
-                "description": lane_description,
-                "vehicle_type": assessment.vehicle_platform.vehicle_type if assessment.vehicle_platform else "truck",
-                "document_url": lane_doc_url,
-                "items": []
-            }
+        # Swim lane details per technical function id, resolved once for all of its assessments
+        function_lanes = {}
+        today = date.today()
+        separator = b'\n'
         
-        # Create roadmap item
-        item = {
-            "id": f"assessment_{assessment.id}",
-            "title": tech_func.name,
-            "description": assessment.notes or f"Assessment for {tech_func.name}",
-            "swim_lane": lane_name,
-            "product_feature_document_url": product_features[0].document_url if product_features else None,
-            "technical_function_document_url": tech_func.document_url,
-            "current_trl": assessment.readiness_level.level,
-            "current_trl_name": assessment.readiness_level.name,
-            "status": assessment.current_status,
-            "status_color": get_status_color(assessment.current_status),
-            "assessor": assessment.assessor,
-            "platform": assessment.vehicle_platform.name,
-            "odd": assessment.odd.name,
-            "environment": assessment.environment.name,
-            "trailer": assessment.trailer.name if assessment.trailer else None,
-            "assessment_date": assessment.assessment_date.isoformat(),
-            "scheduled_completion": assessment.scheduled_completion_date.isoformat() if assessment.scheduled_completion_date else None,
-            "timeline_position": calculate_timeline_position(assessment),
-            "miro_properties": {
-                "shape": "sticky_note",
-                "width": 200,
-                "height": 150,
-                "text_color": "#000000",
-                "background_color": get_status_color(assessment.current_status)
+        # Group assessments by technical function (since we don't have direct product feature relationship)
+        for assessment in assessments:
+            tech_func = assessment.technical_function
+            
+            function_lane = function_lanes.get(tech_func.id)
+            if function_lane is None:
+                # Find product features through capabilities
+                product_features = []
+                for capability in tech_func.capabilities:
+                    for pf in capability.product_features:
+                        if pf not in product_features:
+                            product_features.append(pf)
+                
+                # Use the technical function as the swim lane if no product features found
+                if not product_features:
+                    function_lane = (f"Technical Function: {tech_func.name}", tech_func.description or "", tech_func.document_url, None)
+                else:
+                    # Use the first product feature as the swim lane
+                    pf = product_features[0]
+                    function_lane = (pf.name, pf.description or "", pf.document_url, pf.document_url)
+                function_lanes[tech_func.id] = function_lane
+            
+            lane_name, lane_description, lane_doc_url, product_feature_doc_url = function_lane
+            
+            swim_lane = swim_lanes.get(lane_name)
+            if swim_lane is None:
+                swim_lane = swim_lanes[lane_name] = {
+                    "name": lane_name,
+                    "description": lane_description,
+                    "vehicle_type": assessment.vehicle_platform.vehicle_type if assessment.vehicle_platform else "truck",
+                    "document_url": lane_doc_url,
+                    "items": []
+                }
+            
+            # Bind values used more than once so each attribute is read a single time
+            status = assessment.current_status
+            status_color = STATUS_COLORS.get(status, DEFAULT_STATUS_COLOR)
+            readiness_level = assessment.readiness_level
+            scheduled_completion_date = assessment.scheduled_completion_date
+            trailer = assessment.trailer
+            
+            # Create roadmap item
+            item = {
+                "id": f"assessment_{assessment.id}",
+                "title": tech_func.name,
+                "description": assessment.notes or f"Assessment for {tech_func.name}",
+                "swim_lane": lane_name,
+                "product_feature_document_url": product_feature_doc_url,
+                "technical_function_document_url": tech_func.document_url,
+                "current_trl": readiness_level.level,
+                "current_trl_name": readiness_level.name,
+                "status": status,
+                "status_color": status_color,
+                "assessor": assessment.assessor,
+                "platform": assessment.vehicle_platform.name,
+                "odd": assessment.odd.name,
+                "environment": assessment.environment.name,
+                "trailer": trailer.name if trailer else None,
+                "assessment_date": assessment.assessment_date.isoformat(),
+                "scheduled_completion": scheduled_completion_date.isoformat() if scheduled_completion_date else None,
+                "timeline_position": calculate_timeline_position(scheduled_completion_date, readiness_level.level, today),
+                "miro_properties": {
+                    "shape": "sticky_note",
+                    "width": 200,
+                    "height": 150,
+                    "text_color": "#000000",
+                    "background_color": status_color
+                }
             }
-        }
+            
+            swim_lane["items"].append(item["id"])
+            yield separator + orjson.dumps(item)
+            separator = b',\n'
         
-        roadmap_data["items"].append(item)
-        roadmap_data["swim_lanes"][lane_name]["items"].append(item["id"])
-    
-    # Add milestones based on scheduled completion dates
-    milestones = generate_milestones(assessments)
-    roadmap_data["timeline"]["milestones"] = milestones
+        # Swim lanes and milestones are only complete once every assessment has been seen
+        timeline = {
+            "quarters": generate_quarters(),
+            "milestones": generate_milestones(assessments)
+        }
+        yield b'\n],"swim_lanes":' + orjson.dumps(swim_lanes) + b',"timeline":' + orjson.dumps(timeline) + b'}'
     
     # Return as JSON with proper headers for download
-    response = app.response_class(
-        response=json.dumps(roadmap_data, indent=2),
-        status=200,
-        mimetype='application/json'
+    return app.response_class(
+        stream_with_context(generate_roadmap()),
+        mimetype='application/json',
+        headers={'Content-Disposition': f'attachment; filename="miro_roadmap_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json"'}
     )
-    response.headers['Content-Disposition'] = f'attachment; filename="miro_roadmap_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json"'
-    
-    return response
 
 @app.route('/export/miro_csv')
 def export_miro_csv():
     """Export assessment data as CSV for Miro import"""
-    import csv
-    import io
-    from datetime import datetime
-    
-    # Get all assessments with proper joins
-    assessments = db.session.query(ReadinessAssessment).join(
-        TechnicalFunction
-    ).join(TechnicalReadinessLevel).join(
-        VehiclePlatform
-    ).join(ODD).join(Environment).all()
-    
-    # Create CSV content
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # CSV headers for Miro import
-    writer.writerow([
-        'Title', 'Description', 'Product Feature', 'Current TRL', 'Status', 
-        'Status Color', 'Assessor', 'Platform', 'ODD', 'Environment', 
-        'Assessment Date', 'Scheduled Completion', 'Timeline Quarter', 'Notes',
-        'Product Feature Document URL', 'Technical Function Document URL'
-    ])
-    
-    for assessment in assessments:
-        tech_func = assessment.technical_function
-        
-        # Find product features through capabilities
-        product_features = []
-        for capability in tech_func.capabilities:
-            for pf in capability.product_features:
-                if pf not in product_features:
-                    product_features.append(pf)
-        
-        # Use first product feature or technical function name
-        product_feature_name = product_features[0].name if product_features else f"Technical Function: {tech_func.name}"
-        product_feature_doc_url = product_features[0].document_url if product_features else ""
-        
-        timeline_pos = calculate_timeline_position(assessment)
-        
-        # Get all product feature names for display
-        pf_names = [pf.name for pf in product_features]
-        product_feature_name = ", ".join(pf_names) if pf_names else "No Product Feature"
-        
-        # Get document URLs from product features
-        doc_urls = [pf.document_url for pf in product_features if pf.document_url]
-        doc_url = ", ".join(doc_urls) if doc_urls else ""
-        
-        writer.writerow([
-            assessment.technical_function.name,
-            assessment.technical_function.description or assessment.notes or "",
-            product_feature_name,
-            f"TRL {assessment.readiness_level.level}: {assessment.readiness_level.name}",
-            assessment.current_status.upper() if assessment.current_status else "NOT_SET",
-            get_status_color(assessment.current_status),
-            assessment.assessor or "",
-            assessment.vehicle_platform.name,
-            assessment.odd.name,
-            assessment.environment.name,
-            assessment.assessment_date.strftime("%Y-%m-%d"),
-            assessment.scheduled_completion_date.strftime("%Y-%m-%d") if assessment.scheduled_completion_date else "",
-            f"Q{timeline_pos['quarter']}",
-            assessment.notes or "",
-            doc_url,
-            assessment.technical_function.document_url or ""
+    class EchoBuffer:
+        """File-like object that hands each CSV line written to it straight back"""
+        def write(self, value):
+            return value
+    
+    writer = csv.writer(EchoBuffer())
+    
+    def generate_rows():
+        # Stream assessments in batches of 500 with related data loaded per batch;
+        # inner joins keep only assessments with all the columns the CSV needs
+        # Only the columns the CSV rows read are fetched
+        assessments = db.session.scalars(select(ReadinessAssessment).options(*export_load_options(
+            load_only(ReadinessAssessment.notes, ReadinessAssessment.current_status, ReadinessAssessment.assessor,
+                      ReadinessAssessment.assessment_date, ReadinessAssessment.scheduled_completion_date),
+            joinedload(ReadinessAssessment.technical_function, innerjoin=True).options(
+                load_only(TechnicalFunction.name, TechnicalFunction.description, TechnicalFunction.document_url),
+                selectinload(TechnicalFunction.capabilities).options(
+                    load_only(Capabilities.id),
+                    selectinload(Capabilities.product_features).load_only(ProductFeature.name, ProductFeature.document_url)
+                )
+            ),
+            joinedload(ReadinessAssessment.readiness_level, innerjoin=True).load_only(TechnicalReadinessLevel.level, TechnicalReadinessLevel.name),
+            joinedload(ReadinessAssessment.vehicle_platform, innerjoin=True).load_only(VehiclePlatform.name),
+            joinedload(ReadinessAssessment.odd, innerjoin=True).load_only(ODD.name),
+            joinedload(ReadinessAssessment.environment, innerjoin=True).load_only(Environment.name)
+        )).execution_options(yield_per=500))
+        
+        # CSV headers for Miro import
+        yield writer.writerow([
+            'Title', 'Description', 'Product Feature', 'Current TRL', 'Status', 
+            'Status Color', 'Assessor', 'Platform', 'ODD', 'Environment', 
+            'Assessment Date', 'Scheduled Completion', 'Timeline Quarter', 'Notes',
+            'Product Feature Document URL', 'Technical Function Document URL'
         ])
-    
-    # Create temporary CSV file
-    import tempfile
-    import os
-    
-    # Create a temporary file
-    temp_fd, temp_path = tempfile.mkstemp(suffix='.csv', prefix='miro_roadmap_')
-    
-    try:
-        # Write CSV content to temporary file
-        with os.fdopen(temp_fd, 'w', encoding='utf-8', newline='') as temp_file:
-            temp_file.write(output.getvalue())
         
-        # Generate filename with timestamp
-        filename = f"miro_roadmap_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        
-        # Send file as download
-        return send_file(
-            temp_path,
-            as_attachment=True,
-            download_name=filename,
-            mimetype='text/csv'
-        )
-    except Exception as e:
-        # Clean up temp file if error occurs
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
-        raise e
+        today = date.today()
+        for assessment in assessments:
+            tech_func = assessment.technical_function
+            
+            # Find product features through capabilities
+            product_features = []
+            for capability in tech_func.capabilities:
+                for pf in capability.product_features:
+                    if pf not in product_features:
+                        product_features.append(pf)
+            
+            # Bind values used more than once so each attribute is read a single time
+            status = assessment.current_status
+            notes = assessment.notes
+            readiness_level = assessment.readiness_level
+            scheduled_completion_date = assessment.scheduled_completion_date
+            
+            timeline_pos = calculate_timeline_position(scheduled_completion_date, readiness_level.level, today)
+            
+            # Get all product feature names for display
+            pf_names = [pf.name for pf in product_features]
+            product_feature_name = ", ".join(pf_names) if pf_names else "No Product Feature"
+            
+            # Get document URLs from product features
+            doc_urls = [pf.document_url for pf in product_features if pf.document_url]
+            doc_url = ", ".join(doc_urls) if doc_urls else ""
+            
+            yield writer.writerow([
+                tech_func.name,
+                tech_func.description or notes or "",
+                product_feature_name,
+                f"TRL {readiness_level.level}: {readiness_level.name}",
+                status.upper() if status else "NOT_SET",
+                STATUS_COLORS.get(status, DEFAULT_STATUS_COLOR),
+                assessment.assessor or "",
+                assessment.vehicle_platform.name,
+                assessment.odd.name,
+                assessment.environment.name,
+                assessment.assessment_date.date().isoformat(),
+                scheduled_completion_date.isoformat() if scheduled_completion_date else "",
+                f"Q{timeline_pos['quarter']}",
+                notes or "",
+                doc_url,
+                tech_func.document_url or ""
+            ])
+    
+    # Generate filename with timestamp
+    filename = f"miro_roadmap_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    
+    # Send rows to the client as they are produced instead of buffering the whole file
+    return app.response_class(
+        stream_with_context(generate_rows()),
+        mimetype='text/csv',
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
 
-@app.route('/timeline/product_features')
-def product_features_timeline():
-    """Timeline view for Product Features with start and end dates"""
-    from datetime import datetime, timedelta
-    
-    # Get all product features with dates
-    features = ProductFeature.query.filter(
-        (ProductFeature.planned_start_date.isnot(None)) | 
-        (ProductFeature.planned_end_date.isnot(None))
-    ).order_by(ProductFeature.planned_start_date).all()
-    
-    # Calculate timeline range
-    all_dates = []
-    for feature in features:
-        if feature.planned_start_date:
-            all_dates.append(feature.planned_start_date)
-        if feature.planned_end_date:
-            all_dates.append(feature.planned_end_date)
-    
-    if all_dates:
-        min_date = min(all_dates)
-        max_date = max(all_dates)
+# Columns of product features with dates, with the vehicle type joined in, as plain rows.
+# Built as a lambda statement so SQLAlchemy reuses the compiled SQL between requests.
+PRODUCT_FEATURES_TIMELINE_STMT = lambda_stmt(lambda: select(
+    ProductFeature.id,
+    ProductFeature.name,
+    ProductFeature.description,
+    case((VehiclePlatform.id.is_(None), 'Not specified'), else_=VehiclePlatform.vehicle_type),
+    ProductFeature.swimlane_decorators,
+    ProductFeature.status_relative_to_tmos,
+    ProductFeature.planned_start_date,
+    ProductFeature.planned_end_date,
+    ProductFeature.active_flag,
+    ProductFeature.document_url
+).outerjoin(ProductFeature.vehicle_platform).where(
+    (ProductFeature.planned_start_date.isnot(None)) | 
+    (ProductFeature.planned_end_date.isnot(None))
+).order_by(ProductFeature.planned_start_date))
+
+# Timeline rows are cached and cleared along with the other readiness views
+@cache.memoize(timeout=60)
+def get_product_features_timeline():
+    """Get product features timeline rows and the date range they span"""
+    rows = db.session.execute(PRODUCT_FEATURES_TIMELINE_STMT).all()
+    
+    # Calculate timeline range in SQL rather than collecting every date in Python
+    min_date, max_date = get_timeline_bounds(ProductFeature)
+    
+    if min_date:
         # Add buffer to timeline
         timeline_start = min_date - timedelta(days=30)
         timeline_end = max_date + timedelta(days=30)
@@ -803,58 +1080,66 @@ def product_features_timeline():
     
     # Prepare timeline data
     timeline_data = []
-    for feature in features:
+    for (feature_id, name, description, vehicle_type, swimlane_decorators, status_relative_to_tmos,
+         planned_start_date, planned_end_date, active_flag, document_url) in rows:
         item = {
-            'id': feature.id,
-            'name': feature.name,
-            'description': feature.description,
-            'vehicle_type': feature.vehicle_platform.vehicle_type if feature.vehicle_platform else 'Not specified',
-            'swimlane_decorators': feature.swimlane_decorators,
-            'status_relative_to_tmos': feature.status_relative_to_tmos,
-            'planned_start_date': feature.planned_start_date.isoformat() if feature.planned_start_date else None,
-            'planned_end_date': feature.planned_end_date.isoformat() if feature.planned_end_date else None,
-            'active_flag': feature.active_flag,
-            'document_url': feature.document_url,
+            'id': feature_id,
+            'name': name,
+            'description': description,
+            'vehicle_type': vehicle_type,
+            'swimlane_decorators': swimlane_decorators,
+            'status_relative_to_tmos': status_relative_to_tmos,
+            'planned_start_date': planned_start_date.isoformat() if planned_start_date else None,
+            'planned_end_date': planned_end_date.isoformat() if planned_end_date else None,
+            'active_flag': active_flag,
+            'document_url': document_url,
             'duration_days': None,
-            'progress_color': 'success' if feature.status_relative_to_tmos >= 80 else 'warning' if feature.status_relative_to_tmos >= 50 else 'danger'
+            'progress_color': PROGRESS_COLORS[max(0, min(100, int(status_relative_to_tmos)))]
         }
         
         # Calculate duration if both dates exist
-        if feature.planned_start_date and feature.planned_end_date:
-            duration = feature.planned_end_date - feature.planned_start_date
+        if planned_start_date and planned_end_date:
+            duration = planned_end_date - planned_start_date
             item['duration_days'] = duration.days
         
         timeline_data.append(item)
     
-    return render_template('timeline_product_features.html',
-                         timeline_data=timeline_data,
-                         timeline_start=timeline_start.isoformat(),
-                         timeline_end=timeline_end.isoformat(),
-                         page_title="Product Features Timeline")
+    return {
+        'timeline_data': timeline_data,
+        'timeline_start': timeline_start.isoformat(),
+        'timeline_end': timeline_end.isoformat()
+    }
 
-@app.route('/timeline/capabilities')
-def capabilities_timeline():
-    """Timeline view for Capabilities with start and end dates"""
-    from datetime import datetime, timedelta
-    from app import Capabilities
-    
-    # Get all capabilities with dates
-    capabilities = Capabilities.query.filter(
+@app.route('/timeline/product_features')
+def product_features_timeline():
+    """Timeline view for Product Features with start and end dates"""
+    return render_template('timeline_product_features.html', page_title="Product Features Timeline", **get_product_features_timeline())
+
+@cache.memoize(timeout=60)
+def get_capabilities_timeline():
+    """Get capabilities timeline rows and the date range they span"""
+    # Get all capabilities with dates, along with their vehicle platform
+    capabilities = Capabilities.query.options(
+        joinedload(Capabilities.vehicle_platform)
+    ).filter(
         (Capabilities.planned_start_date.isnot(None)) | 
         (Capabilities.planned_end_date.isnot(None))
     ).order_by(Capabilities.planned_start_date).all()
     
-    # Calculate timeline range
-    all_dates = []
-    for capability in capabilities:
-        if capability.planned_start_date:
-            all_dates.append(capability.planned_start_date)
-        if capability.planned_end_date:
-            all_dates.append(capability.planned_end_date)
-    
-    if all_dates:
-        min_date = min(all_dates)
-        max_date = max(all_dates)
+    # Count linked technical functions and product features per capability without loading them
+    technical_function_counts = dict(db.session.query(
+        capability_technical_functions.c.capability_id,
+        db.func.count()
+    ).group_by(capability_technical_functions.c.capability_id).all())
+    product_feature_counts = dict(db.session.query(
+        product_feature_capabilities.c.capability_id,
+        db.func.count()
+    ).group_by(product_feature_capabilities.c.capability_id).all())
+    
+    # Calculate timeline range in SQL rather than collecting every date in Python
+    min_date, max_date = get_timeline_bounds(Capabilities)
+    
+    if min_date:
         # Add buffer to timeline
         timeline_start = min_date - timedelta(days=30)
         timeline_end = max_date + timedelta(days=30)
@@ -867,6 +1152,8 @@ def capabilities_timeline():
     # Prepare timeline data
     timeline_data = []
     for capability in capabilities:
+        planned_start_date = capability.planned_start_date
+        planned_end_date = capability.planned_end_date
         item = {
             'id': capability.id,
             'name': capability.name,
@@ -874,50 +1161,49 @@ def capabilities_timeline():
             'vehicle_type': capability.vehicle_platform.vehicle_type if capability.vehicle_platform else 'Not specified',
             'tmos': capability.tmos,
             'progress_relative_to_tmos': capability.progress_relative_to_tmos,
-            'planned_start_date': capability.planned_start_date.isoformat() if capability.planned_start_date else None,
-            'planned_end_date': capability.planned_end_date.isoformat() if capability.planned_end_date else None,
+            'planned_start_date': planned_start_date.isoformat() if planned_start_date else None,
+            'planned_end_date': planned_end_date.isoformat() if planned_end_date else None,
             'document_url': capability.document_url,
             'duration_days': None,
-            'progress_color': 'success' if capability.progress_relative_to_tmos >= 80 else 'warning' if capability.progress_relative_to_tmos >= 50 else 'danger',
-            'technical_functions_count': len(capability.technical_functions),
-            'product_features_count': len(capability.product_features)
+            'progress_color': PROGRESS_COLORS[max(0, min(100, int(capability.progress_relative_to_tmos)))],
+            'technical_functions_count': technical_function_counts.get(capability.id, 0),
+            'product_features_count': product_feature_counts.get(capability.id, 0)
         }
         
         # Calculate duration if both dates exist
-        if capability.planned_start_date and capability.planned_end_date:
-            duration = capability.planned_end_date - capability.planned_start_date
+        if planned_start_date and planned_end_date:
+            duration = planned_end_date - planned_start_date
             item['duration_days'] = duration.days
         
         timeline_data.append(item)
     
-    return render_template('timeline_capabilities.html',
-                         timeline_data=timeline_data,
-                         timeline_start=timeline_start.isoformat(),
-                         timeline_end=timeline_end.isoformat(),
-                         page_title="Capabilities Timeline")
+    return {
+        'timeline_data': timeline_data,
+        'timeline_start': timeline_start.isoformat(),
+        'timeline_end': timeline_end.isoformat()
+    }
 
-@app.route('/timeline/technical_functions')
-def technical_functions_timeline():
-    """Timeline view for Technical Functions with start and end dates"""
-    from datetime import datetime, timedelta
-    
-    # Get all technical functions with dates
-    tech_functions = TechnicalFunction.query.filter(
+@app.route('/timeline/capabilities')
+def capabilities_timeline():
+    """Timeline view for Capabilities with start and end dates"""
+    return render_template('timeline_capabilities.html', page_title="Capabilities Timeline", **get_capabilities_timeline())
+
+@cache.memoize(timeout=60)
+def get_technical_functions_timeline():
+    """Get technical functions timeline rows and the date range they span"""
+    # Get all technical functions with dates, along with their platform and product features
+    tech_functions = TechnicalFunction.query.options(
+        joinedload(TechnicalFunction.vehicle_platform),
+        selectinload(TechnicalFunction.capabilities).selectinload(Capabilities.product_features)
+    ).filter(
         (TechnicalFunction.planned_start_date.isnot(None)) | 
         (TechnicalFunction.planned_end_date.isnot(None))
     ).order_by(TechnicalFunction.planned_start_date).all()
     
-    # Calculate timeline range
-    all_dates = []
-    for func in tech_functions:
-        if func.planned_start_date:
-            all_dates.append(func.planned_start_date)
-        if func.planned_end_date:
-            all_dates.append(func.planned_end_date)
-    
-    if all_dates:
-        min_date = min(all_dates)
-        max_date = max(all_dates)
+    # Calculate timeline range in SQL rather than collecting every date in Python
+    min_date, max_date = get_timeline_bounds(TechnicalFunction)
+    
+    if min_date:
         # Add buffer to timeline
         timeline_start = min_date - timedelta(days=30)
         timeline_end = max_date + timedelta(days=30)
@@ -927,13 +1213,36 @@ def technical_functions_timeline():
         timeline_start = today
         timeline_end = today + timedelta(days=365)
     
+    tech_function_ids = [func.id for func in tech_functions]
+    
+    # Fetch only the latest readiness assessment per technical function using a window query
+    ranked_assessments = db.session.query(
+        ReadinessAssessment.id,
+        db.func.row_number().over(
+            partition_by=ReadinessAssessment.technical_capability_id,
+            order_by=ReadinessAssessment.assessment_date.desc()
+        ).label('rn')
+    ).filter(ReadinessAssessment.technical_capability_id.in_(tech_function_ids)).subquery()
+    latest_assessments = {
+        assessment.technical_capability_id: assessment
+        for assessment in ReadinessAssessment.query.join(
+            ranked_assessments, ReadinessAssessment.id == ranked_assessments.c.id
+        ).filter(ranked_assessments.c.rn == 1).options(joinedload(ReadinessAssessment.readiness_level)).all()
+    }
+    
+    # Count assessments per technical function without loading them
+    assessment_counts = dict(db.session.query(
+        ReadinessAssessment.technical_capability_id,
+        db.func.count(ReadinessAssessment.id)
+    ).filter(ReadinessAssessment.technical_capability_id.in_(tech_function_ids)).group_by(ReadinessAssessment.technical_capability_id).all())
+    
     # Prepare timeline data
     timeline_data = []
     for func in tech_functions:
         # Get latest readiness assessment for this function
-        latest_assessment = ReadinessAssessment.query.filter_by(
-            technical_capability_id=func.id
-        ).order_by(ReadinessAssessment.assessment_date.desc()).first()
+        latest_assessment = latest_assessments.get(func.id)
+        planned_start_date = func.planned_start_date
+        planned_end_date = func.planned_end_date
         
         item = {
             'id': func.id,
@@ -943,16 +1252,16 @@ def technical_functions_timeline():
             'vehicle_type': func.vehicle_platform.vehicle_type if func.vehicle_platform else 'Not specified',
             'tmos': func.tmos,
             'status_relative_to_tmos': func.status_relative_to_tmos,
-            'planned_start_date': func.planned_start_date.isoformat() if func.planned_start_date else None,
-            'planned_end_date': func.planned_end_date.isoformat() if func.planned_end_date else None,
+            'planned_start_date': planned_start_date.isoformat() if planned_start_date else None,
+            'planned_end_date': planned_end_date.isoformat() if planned_end_date else None,
             'document_url': func.document_url,
             'product_feature_name': 'No Product Feature',  # Default value
             'product_feature_id': None,
             'duration_days': None,
-            'progress_color': 'success' if func.status_relative_to_tmos >= 80 else 'warning' if func.status_relative_to_tmos >= 50 else 'danger',
+            'progress_color': PROGRESS_COLORS[max(0, min(100, int(func.status_relative_to_tmos)))],
             'current_trl': None,
             'current_status': None,
-            'assessments_count': len(func.readiness_assessments)
+            'assessments_count': assessment_counts.get(func.id, 0)
         }
         
         # Get product features through capabilities (M:N relationship)
@@ -976,17 +1285,37 @@ def technical_functions_timeline():
             item['current_status'] = latest_assessment.current_status
         
         # Calculate duration if both dates exist
-        if func.planned_start_date and func.planned_end_date:
-            duration = func.planned_end_date - func.planned_start_date
+        if planned_start_date and planned_end_date:
+            duration = planned_end_date - planned_start_date
             item['duration_days'] = duration.days
         
         timeline_data.append(item)
     
-    return render_template('timeline_technical_functions.html',
-                         timeline_data=timeline_data,
-                         timeline_start=timeline_start.isoformat(),
-                         timeline_end=timeline_end.isoformat(),
-                         page_title="Technical Functions Timeline")
+    return {
+        'timeline_data': timeline_data,
+        'timeline_start': timeline_start.isoformat(),
+        'timeline_end': timeline_end.isoformat()
+    }
+
+@app.route('/timeline/technical_functions')
+def technical_functions_timeline():
+    """Timeline view for Technical Functions with start and end dates"""
+    return render_template('timeline_technical_functions.html', page_title="Technical Functions Timeline", **get_technical_functions_timeline())
+
+# Timeline builders by entity, shared by the timeline pages and their JSON API
+TIMELINE_BUILDERS = {
+    'product_features': get_product_features_timeline,
+    'capabilities': get_capabilities_timeline,
+    'technical_functions': get_technical_functions_timeline
+}
+
+@app.route('/api/timeline/<entity>')
+def api_timeline_data(entity):
+    """API endpoint for timeline rows and date range, for clients that draw the timeline themselves"""
+    if entity not in TIMELINE_BUILDERS:
+        return jsonify({'error': 'Invalid timeline type'}), 404
+    return jsonify(TIMELINE_BUILDERS[entity]())
+
 
 
 # Configuration Management Routes
@@ -1056,6 +1385,9 @@ def add_config_item(config_type):
         
         db.session.add(new_item)
         db.session.commit()
+        cache.delete_memoized(CONFIG_LOOKUPS[config_type])
+        # Matrix, dashboard and timeline data show platform, ODD and environment names
+        clear_readiness_caches()
         
         return jsonify({'success': True, 'message': f'{config_type.title()} added successfully'})
         
@@ -1096,6 +1428,9 @@ def delete_config_item(config_type, item_id):
         
         db.session.delete(item)
         db.session.commit()
+        cache.delete_memoized(CONFIG_LOOKUPS[config_type])
+        # Matrix, dashboard and timeline data show platform, ODD and environment names
+        clear_readiness_caches()
         
         return jsonify({'success': True, 'message': f'{config_type.title()} deleted successfully'})
         
@@ -1107,11 +1442,6 @@ def delete_config_item(config_type, item_id):
 @app.route('/download/database.json')
 def download_database_json():
     """Download complete database as JSON file"""
-    from datetime import datetime
-    import json
-    import tempfile
-    import os
-    
     try:
         # Collect all data from the database
         database_export = {
@@ -1264,30 +1594,20 @@ def download_database_json():
                 "axle_count": trailer.axle_count
             })
         
-        # Create temporary JSON file
-        temp_fd, temp_path = tempfile.mkstemp(suffix='.json', prefix='database_export_')
+        # Encode the export in memory and send it directly, without a temporary file to write and clean up
+        export_file = io.BytesIO(json.dumps(database_export, indent=2, ensure_ascii=False).encode('utf-8'))
+        
+        # Generate filename with timestamp
+        filename = f"product_features_database_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        
+        # Send file as download
+        return send_file(
+            export_file,
+            as_attachment=True,
+            download_name=filename,
+            mimetype='application/json'
+        )
         
-        try:
-            # Write JSON content to temporary file
-            with os.fdopen(temp_fd, 'w', encoding='utf-8') as temp_file:
-                json.dump(database_export, temp_file, indent=2, ensure_ascii=False)
-            
-            # Generate filename with timestamp
-            filename = f"product_features_database_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            
-            # Send file as download
-            return send_file(
-                temp_path,
-                as_attachment=True,
-                download_name=filename,
-                mimetype='application/json'
-            )
-        except Exception as e:
-            # Clean up temp file if error occurs
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-            raise e
-            
     except Exception as e:
         return jsonify({'error': f'Failed to export database: {str(e)}'}), 500
 
@@ -1364,7 +1684,6 @@ def save_json_data():
         # Create backup of existing file
         if os.path.exists(output_file):
             backup_file = f'{output_file}.backup.{datetime.now().strftime("%Y%m%d_%H%M%S")}'
-            import shutil
             shutil.copy2(output_file, backup_file)
             print(f"Created backup: {backup_file}")
         
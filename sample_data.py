@@ -1,22 +1,35 @@
 from app import app, db, ProductFeature, TechnicalFunction, TechnicalReadinessLevel, VehiclePlatform, ODD, Environment, Trailer, ReadinessAssessment, Capabilities
+from datetime import date, timedelta
+import random
+
+# Vehicle type string to platform ID, based on existing vehicle platform data
+VEHICLE_PLATFORM_IDS = {
+    "truck": 5,      # Truck Platform
+    "van": 6,        # Van Platform  
+    "car": 7,        # Car Platform
+    "terberg": 1,    # Terberg ATT
+    "ca500": 2,      # CA500
+    "t800": 3,       # T800
+    "aev": 4,        # AEV
+    "all": 8     # Any Platform
+}
 
 def get_vehicle_platform_id(vehicle_type_str):
     """Map vehicle type string to platform ID"""
-    # Create mapping based on existing vehicle platform data
-    mapping = {
-        "truck": 5,      # Truck Platform
-        "van": 6,        # Van Platform  
-        "car": 7,        # Car Platform
-        "terberg": 1,    # Terberg ATT
-        "ca500": 2,      # CA500
-        "t800": 3,       # T800
-        "aev": 4,        # AEV
-        "all": 8     # Any Platform
-    }
-    return mapping.get(vehicle_type_str.lower(), 8)  # Default to Generic Platform
+    return VEHICLE_PLATFORM_IDS.get(vehicle_type_str.lower(), 8)  # Default to Generic Platform
 
 def initialize_sample_data():
-    """Initialize the database with sample data"""
+    """Initialize the database with sample data in a single transaction"""
+    try:
+        populate_sample_data()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    print("Sample data initialized successfully!")
+
+def populate_sample_data():
+    """Add the sample rows without committing; initialize_sample_data() commits them"""
     
     # Technical Readiness Levels (TRL 1-9)
     trl_data = [
@@ -31,9 +44,11 @@ def initialize_sample_data():
         (9, "Actual system proven in operational environment", "Actual application of technology in its final form")
     ]
     
-    for level, name, description in trl_data:
-        trl = TechnicalReadinessLevel(level=level, name=name, description=description)
-        db.session.add(trl)
+    # Reference tables are inserted as plain mappings in one executemany each, skipping per-object ORM bookkeeping
+    db.session.bulk_insert_mappings(TechnicalReadinessLevel, [
+        {'level': level, 'name': name, 'description': description}
+        for level, name, description in trl_data
+    ])
     
     # Product Features
     product_features = [
@@ -57,24 +72,14 @@ def initialize_sample_data():
          "truck", "Management", "PF-MGMT-1.0", "Manage 50+ vehicle fleet with 99% uptime and optimal routing", 75.0, "2024-01-01", "2024-11-30", "active", "https://confluence.company.com/fleet-management")
     ]
     
-    from datetime import datetime
-    for name, description, vehicle_type, swimlane, label, tmos, status, start_date, end_date, active_flag, document_url in product_features:
-        feature = ProductFeature(
-            name=name, 
-            description=description,
-            vehicle_platform_id=get_vehicle_platform_id(vehicle_type),
-            swimlane_decorators=swimlane,
-            label=label,
-            tmos=tmos,
-            status_relative_to_tmos=status,
-            planned_start_date=datetime.strptime(start_date, '%Y-%m-%d').date(),
-            planned_end_date=datetime.strptime(end_date, '%Y-%m-%d').date(),
-            active_flag=active_flag,
-            document_url=document_url
-        )
-        db.session.add(feature)
-    
-    db.session.commit()  # Commit to get IDs
+    db.session.bulk_insert_mappings(ProductFeature, [
+        {'name': name, 'description': description, 'vehicle_platform_id': get_vehicle_platform_id(vehicle_type),
+         'swimlane_decorators': swimlane, 'label': label, 'tmos': tmos, 'status_relative_to_tmos': status,
+         'planned_start_date': date.fromisoformat(start_date),
+         'planned_end_date': date.fromisoformat(end_date),
+         'active_flag': active_flag, 'document_url': document_url}
+        for name, description, vehicle_type, swimlane, label, tmos, status, start_date, end_date, active_flag, document_url in product_features
+    ])
     
     # Technical Functions (formerly Technical Capabilities)
     technical_functions = [
@@ -158,22 +163,16 @@ def initialize_sample_data():
          "truck", "Predict 90% of maintenance needs 48 hours in advance", 70.0, "2024-02-01", "2024-12-31", 7, None)
     ]
     
-    from datetime import datetime
-    for (name, description, success_criteria, vehicle_type, tmos, status, 
-         start_date, end_date, product_id, document_url) in technical_functions:
-        capability = TechnicalFunction(
-            name=name, 
-            description=description,
-            success_criteria=success_criteria,
-            vehicle_platform_id=get_vehicle_platform_id(vehicle_type),
-            tmos=tmos,
-            status_relative_to_tmos=status,
-            planned_start_date=datetime.strptime(start_date, '%Y-%m-%d').date(),
-            planned_end_date=datetime.strptime(end_date, '%Y-%m-%d').date(),
-            product_feature_id=product_id,
-            document_url=document_url
-        )
-        db.session.add(capability)
+    # The product id column is left over from before functions were linked through capabilities
+    db.session.bulk_insert_mappings(TechnicalFunction, [
+        {'name': name, 'description': description, 'success_criteria': success_criteria,
+         'vehicle_platform_id': get_vehicle_platform_id(vehicle_type), 'tmos': tmos, 'status_relative_to_tmos': status,
+         'planned_start_date': date.fromisoformat(start_date),
+         'planned_end_date': date.fromisoformat(end_date),
+         'document_url': document_url}
+        for (name, description, success_criteria, vehicle_type, tmos, status,
+             start_date, end_date, product_id, document_url) in technical_functions
+    ])
     
     # Vehicle Platforms
     vehicle_platforms = [
@@ -187,9 +186,10 @@ def initialize_sample_data():
         ("Generic Platform", "Generic vehicle platform", "generic", 2000)
     ]
     
-    for name, description, vehicle_type, max_payload in vehicle_platforms:
-        platform = VehiclePlatform(name=name, description=description, vehicle_type=vehicle_type, max_payload=max_payload)
-        db.session.add(platform)
+    db.session.bulk_insert_mappings(VehiclePlatform, [
+        {'name': name, 'description': description, 'vehicle_type': vehicle_type, 'max_payload': max_payload}
+        for name, description, vehicle_type, max_payload in vehicle_platforms
+    ])
     
     # ODDs (Operational Design Domains)
     odds = [
@@ -199,12 +199,13 @@ def initialize_sample_data():
         ("Factory: baseline", "Limited access roads and depots", 8, "one-way", "Nominal lanes width (+1m - +2.0m buffer)", "junctions", "tunnels", "school zones", "pedestrians, cyclists", "crane, gantry (stacked)", "dry", "max uphill 2%, max downhill 2%")
     ]
     
-    for name, description, max_speed, direction, lanes, intersections, infrastructure, hazards, actors, handling_equipment, traction, inclines in odds:
-        odd = ODD(name=name, description=description, max_speed=max_speed, 
-                 direction=direction, lanes=lanes, intersections=intersections,
-                 infrastructure=infrastructure, hazards=hazards, actors=actors,
-                 handling_equipment=handling_equipment, traction=traction, inclines=inclines)
-        db.session.add(odd)
+    db.session.bulk_insert_mappings(ODD, [
+        {'name': name, 'description': description, 'max_speed': max_speed,
+         'direction': direction, 'lanes': lanes, 'intersections': intersections,
+         'infrastructure': infrastructure, 'hazards': hazards, 'actors': actors,
+         'handling_equipment': handling_equipment, 'traction': traction, 'inclines': inclines}
+        for name, description, max_speed, direction, lanes, intersections, infrastructure, hazards, actors, handling_equipment, traction, inclines in odds
+    ])
     
     # Environments
     environments = [
@@ -214,10 +215,11 @@ def initialize_sample_data():
         ("Cold Climate", "Northern regions with harsh winters", "Global", "arctic", "varied")
     ]
     
-    for name, description, region, climate, terrain in environments:
-        env = Environment(name=name, description=description, region=region, 
-                         climate=climate, terrain=terrain)
-        db.session.add(env)
+    db.session.bulk_insert_mappings(Environment, [
+        {'name': name, 'description': description, 'region': region,
+         'climate': climate, 'terrain': terrain}
+        for name, description, region, climate, terrain in environments
+    ])
     
     # Trailers
     trailers = [
@@ -234,16 +236,13 @@ def initialize_sample_data():
         ("Drawbar trailer: XX model, single, variable weight", "Drawbar trailer", "DBsingle", 12, 15000, 1)
     ]
     
-    for name, description, trailer_type, length, max_weight, axle_count in trailers:
-        trailer = Trailer(name=name, description=description, trailer_type=trailer_type,
-                         length=length, max_weight=max_weight, axle_count=axle_count)
-        db.session.add(trailer)
-    
-    db.session.commit()  # Commit to get all IDs
+    db.session.bulk_insert_mappings(Trailer, [
+        {'name': name, 'description': description, 'trailer_type': trailer_type,
+         'length': length, 'max_weight': max_weight, 'axle_count': axle_count}
+        for name, description, trailer_type, length, max_weight, axle_count in trailers
+    ])
     
     # Sample Readiness Assessments
-    import random
-    from datetime import date, timedelta
     
     # Get all entities for creating assessments
     tech_caps = TechnicalFunction.query.all()
@@ -256,32 +255,39 @@ def initialize_sample_data():
     assessors = ["Dr. Smith", "Engineer Johnson", "Tech Lead Davis", "Manager Wilson"]
     current_status_options = ["green", "yellow", "red"]
     
-    # Create sample assessments
+    # TRL pools and trailer ids are the same for every assessment, so build them once
+    mature_trl_levels = [trl for trl in trl_levels if trl.level >= 6]
+    developing_trl_levels = [trl for trl in trl_levels if 4 <= trl.level <= 7]
+    trailer_ids = [trailer.id for trailer in trailers_list]
+    
+    # Create sample assessments, collected as mappings and inserted in one batch
+    assessment_rows = []
     for tech_cap in tech_caps[:10]:  # Limit to first 10 for demo
         for platform in platforms[:2]:  # First 2 platforms
             for odd in odds_list[:2]:  # First 2 ODDs
                 for env in envs[:2]:  # First 2 environments
                     # Randomly assign TRL based on capability maturity
                     if "Perception" in tech_cap.name or "Control" in tech_cap.name:
-                        trl_level = random.choice([trl for trl in trl_levels if trl.level >= 6])
+                        trl_level = random.choice(mature_trl_levels)
                     elif "Communication" in tech_cap.name or "Planning" in tech_cap.name:
-                        trl_level = random.choice([trl for trl in trl_levels if 4 <= trl.level <= 7])
+                        trl_level = random.choice(developing_trl_levels)
                     else:
                         trl_level = random.choice(trl_levels)
                     
-                    assessment = ReadinessAssessment(
-                        technical_capability_id=tech_cap.id,
-                        readiness_level_id=trl_level.id,
-                        vehicle_platform_id=platform.id,
-                        odd_id=odd.id,
-                        environment_id=env.id,
-                        trailer_id=random.choice(trailers_list).id if random.random() > 0.3 else None,
-                        assessor=random.choice(assessors),
-                        notes=f"Assessment for {tech_cap.name} on {platform.name}",
-                        current_status=random.choice(current_status_options),
-                        next_review_date=date.today() + timedelta(days=random.randint(30, 180))
-                    )
-                    db.session.add(assessment)
+                    assessment_rows.append({
+                        'technical_capability_id': tech_cap.id,
+                        'readiness_level_id': trl_level.id,
+                        'vehicle_platform_id': platform.id,
+                        'odd_id': odd.id,
+                        'environment_id': env.id,
+                        'trailer_id': random.choice(trailer_ids) if random.random() > 0.3 else None,
+                        'assessor': random.choice(assessors),
+                        'notes': f"Assessment for {tech_cap.name} on {platform.name}",
+                        'current_status': random.choice(current_status_options),
+                        'next_review_date': date.today() + timedelta(days=random.randint(30, 180))
+                    })
+    
+    db.session.bulk_insert_mappings(ReadinessAssessment, assessment_rows)
     
     # Create sample Capabilities
     capabilities_data = [
@@ -327,120 +333,84 @@ def initialize_sample_data():
         )
     ]
     
-    from datetime import datetime
-    for name, criteria, vehicle_type, start_date, end_date, tmos, progress, document_url in capabilities_data:
-        capability = Capabilities(
-            name=name,
-            success_criteria=criteria,
-            vehicle_platform_id=get_vehicle_platform_id(vehicle_type),
-            planned_start_date=datetime.strptime(start_date, '%Y-%m-%d').date(),
-            planned_end_date=datetime.strptime(end_date, '%Y-%m-%d').date(),
-            tmos=tmos,
-            progress_relative_to_tmos=progress,
-            document_url=document_url
-        )
-        db.session.add(capability)
-    
-    db.session.commit()
-    
-    # Associate capabilities with technical functions and product features
-    capabilities = Capabilities.query.all()
-    product_features = ProductFeature.query.all()
-    technical_functions = TechnicalFunction.query.all()
-    
-    # Associate "Autonomous Terminal Operations" with relevant functions and features
-    terminal_ops = Capabilities.query.filter_by(name="Autonomous Terminal Operations").first()
-    if terminal_ops:
-        # Add technical functions
-        perception = TechnicalFunction.query.filter_by(name="Perception System").first()
-        path_planning = TechnicalFunction.query.filter_by(name="Path Planning").first()
-        vehicle_control = TechnicalFunction.query.filter_by(name="Vehicle Control").first()
-        localization = TechnicalFunction.query.filter_by(name="Localization").first()
+    db.session.bulk_insert_mappings(Capabilities, [
+        {'name': name, 'success_criteria': criteria, 'vehicle_platform_id': get_vehicle_platform_id(vehicle_type),
+         'planned_start_date': date.fromisoformat(start_date),
+         'planned_end_date': date.fromisoformat(end_date),
+         'tmos': tmos, 'progress_relative_to_tmos': progress, 'document_url': document_url}
+        for name, criteria, vehicle_type, start_date, end_date, tmos, progress, document_url in capabilities_data
+    ])
+    
+    # Lookups below would otherwise autoflush the pending association appends on every query
+    with db.session.no_autoflush:
+        # Associate capabilities with technical functions and product features
+        capabilities = Capabilities.query.all()
+        product_features = ProductFeature.query.all()
+        technical_functions = TechnicalFunction.query.all()
         
-        if perception:
-            terminal_ops.technical_functions.append(perception)
-        if path_planning:
-            terminal_ops.technical_functions.append(path_planning)
-        if vehicle_control:
-            terminal_ops.technical_functions.append(vehicle_control)
-        if localization:
-            terminal_ops.technical_functions.append(localization)
+        # Associate "Autonomous Terminal Operations" with relevant functions and features
+        terminal_ops = Capabilities.query.filter_by(name="Autonomous Terminal Operations").first()
+        if terminal_ops:
+            # Add technical functions
+            perception = TechnicalFunction.query.filter_by(name="Perception System").first()
+            path_planning = TechnicalFunction.query.filter_by(name="Path Planning").first()
+            vehicle_control = TechnicalFunction.query.filter_by(name="Vehicle Control").first()
+            localization = TechnicalFunction.query.filter_by(name="Localization").first()
             
-        # Add product features
-        terberg_ops = ProductFeature.query.filter_by(name="Terberg: Driver-in operations (semi-trailer)").first()
-        if terberg_ops:
-            terminal_ops.product_features.append(terberg_ops)
-    
-    # Associate "Highway Platooning" with relevant functions and features
-    platooning = Capabilities.query.filter_by(name="Highway Platooning").first()
-    if platooning:
-        # Add technical functions
-        v2v_comm = TechnicalFunction.query.filter_by(name="Vehicle-to-Vehicle Communication").first()
-        convoy_formation = TechnicalFunction.query.filter_by(name="Convoy Formation").first()
+            if perception:
+                terminal_ops.technical_functions.append(perception)
+            if path_planning:
+                terminal_ops.technical_functions.append(path_planning)
+            if vehicle_control:
+                terminal_ops.technical_functions.append(vehicle_control)
+            if localization:
+                terminal_ops.technical_functions.append(localization)
+                
+            # Add product features
+            terberg_ops = ProductFeature.query.filter_by(name="Terberg: Driver-in operations (semi-trailer)").first()
+            if terberg_ops:
+                terminal_ops.product_features.append(terberg_ops)
         
-        if v2v_comm:
-            platooning.technical_functions.append(v2v_comm)
-        if convoy_formation:
-            platooning.technical_functions.append(convoy_formation)
-        if vehicle_control:
-            platooning.technical_functions.append(vehicle_control)
+        # Associate "Highway Platooning" with relevant functions and features
+        platooning = Capabilities.query.filter_by(name="Highway Platooning").first()
+        if platooning:
+            # Add technical functions
+            v2v_comm = TechnicalFunction.query.filter_by(name="Vehicle-to-Vehicle Communication").first()
+            convoy_formation = TechnicalFunction.query.filter_by(name="Convoy Formation").first()
             
-        # Add product features  
-        platooning_feature = ProductFeature.query.filter_by(name="Platooning").first()
-        if platooning_feature:
-            platooning.product_features.append(platooning_feature)
-    
-    # Add sample product feature dependencies
-    terberg_driver_in = ProductFeature.query.filter_by(name="Terberg: Driver-in operations (semi-trailer)").first()
-    terberg_driver_out = ProductFeature.query.filter_by(name="Terberg: Driver-Out, AV only, FWD").first()
-    platooning_pf = ProductFeature.query.filter_by(name="Platooning").first()
-    remote_ops = ProductFeature.query.filter_by(name="Remote Vehicle Operation").first()
-    fleet_mgmt = ProductFeature.query.filter_by(name="Fleet Management").first()
-    cargo_automation = ProductFeature.query.filter_by(name="Cargo Handling Automation").first()
-    
-    # Set up dependencies: Driver-Out depends on Driver-in
-    if terberg_driver_out and terberg_driver_in:
-        terberg_driver_out.dependencies.append(terberg_driver_in)
-    
-    # Platooning depends on Driver-Out operations
-    if platooning_pf and terberg_driver_out:
-        platooning_pf.dependencies.append(terberg_driver_out)
-    
-    # Fleet Management depends on Remote Vehicle Operation
-    if fleet_mgmt and remote_ops:
-        fleet_mgmt.dependencies.append(remote_ops)
-    
-    # Cargo Automation depends on both Driver-Out and Fleet Management
-    if cargo_automation and terberg_driver_out and fleet_mgmt:
-        cargo_automation.dependencies.append(terberg_driver_out)
-        cargo_automation.dependencies.append(fleet_mgmt)
-    
-    # Add sample technical function dependencies
-    # Get technical functions for creating dependencies
-    perception = TechnicalFunction.query.filter_by(name="Perception System").first()
-    path_planning = TechnicalFunction.query.filter_by(name="Path Planning").first()
-    vehicle_control = TechnicalFunction.query.filter_by(name="Vehicle Control").first()
-    localization = TechnicalFunction.query.filter_by(name="Localization").first()
-    v2v_comm = TechnicalFunction.query.filter_by(name="Vehicle-to-Vehicle Communication").first()
-    convoy_formation = TechnicalFunction.query.filter_by(name="Convoy Formation").first()
-    teleoperation = TechnicalFunction.query.filter_by(name="Teleoperation Interface").first()
-    
-    # Path Planning depends on Perception System and Localization product features
-    if path_planning and terberg_driver_in:
-        path_planning.product_feature_dependencies.append(terberg_driver_in)
-    
-    # Vehicle Control depends on multiple basic functions via product features
-    if vehicle_control and terberg_driver_in:
-        vehicle_control.product_feature_dependencies.append(terberg_driver_in)
-    
-    # Convoy Formation depends on V2V Communication
-    if convoy_formation and v2v_comm:
-        # These would need product feature dependencies if we had more complex relationships
-        pass
-    
-    # Teleoperation depends on Remote Vehicle Operation capability
-    if teleoperation and platooning:  # Using platooning capability as example
-        teleoperation.capability_dependencies.append(platooning)
-    
-    db.session.commit()
-    print("Sample data initialized successfully!")
\ No newline at end of file
+            if v2v_comm:
+                platooning.technical_functions.append(v2v_comm)
+            if convoy_formation:
+                platooning.technical_functions.append(convoy_formation)
+            if vehicle_control:
+                platooning.technical_functions.append(vehicle_control)
+                
+            # Add product features  
+            platooning_feature = ProductFeature.query.filter_by(name="Platooning").first()
+            if platooning_feature:
+                platooning.product_features.append(platooning_feature)
+        
+        # Add sample product feature dependencies
+        terberg_driver_in = ProductFeature.query.filter_by(name="Terberg: Driver-in operations (semi-trailer)").first()
+        terberg_driver_out = ProductFeature.query.filter_by(name="Terberg: Driver-Out, AV only, FWD").first()
+        platooning_pf = ProductFeature.query.filter_by(name="Platooning").first()
+        remote_ops = ProductFeature.query.filter_by(name="Remote Vehicle Operation").first()
+        fleet_mgmt = ProductFeature.query.filter_by(name="Fleet Management").first()
+        cargo_automation = ProductFeature.query.filter_by(name="Cargo Handling Automation").first()
+        
+        # Set up dependencies: Driver-Out depends on Driver-in
+        if terberg_driver_out and terberg_driver_in:
+            terberg_driver_out.dependencies.append(terberg_driver_in)
+        
+        # Platooning depends on Driver-Out operations
+        if platooning_pf and terberg_driver_out:
+            platooning_pf.dependencies.append(terberg_driver_out)
+        
+        # Fleet Management depends on Remote Vehicle Operation
+        if fleet_mgmt and remote_ops:
+            fleet_mgmt.dependencies.append(remote_ops)
+        
+        # Cargo Automation depends on both Driver-Out and Fleet Management
+        if cargo_automation and terberg_driver_out and fleet_mgmt:
+            cargo_automation.dependencies.append(terberg_driver_out)
+            cargo_automation.dependencies.append(fleet_mgmt)
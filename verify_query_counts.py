@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Verification script for the number of SQL queries issued by the read-heavy routes.
+Runs the app in-process against the configured database and exits non-zero when a
+route goes over its query budget, e.g. because an eager load was dropped.
+"""
+
+import contextlib
+import sys
+from sqlalchemy import event
+from app import app, db, cache
+
+# Maximum number of queries per route; these must not grow with the number of rows
+QUERY_BUDGETS = {
+    '/': 5,
+    '/readiness_matrix': 1,
+    '/api/readiness_data': 1,
+    '/export': 1,
+    '/export/miro_roadmap': 3,
+    '/export/miro_csv': 3,
+    '/timeline/product_features': 2,
+    '/timeline/capabilities': 4,
+    '/timeline/technical_functions': 6,
+}
+
+@contextlib.contextmanager
+def count_queries(engine):
+    """Collect the SQL statements executed on the engine while the block runs"""
+    queries = []
+    
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+    
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+def verify_query_counts():
+    """Request each route once and compare its query count with the budget"""
+    
+    print("🔍 Verifying query counts per route")
+    print("=" * 60)
+    
+    # Any relationship lazy load fails the route, as does the export queries' raiseload('*')
+    app.config['TESTING'] = True
+    app.config['LAZY_LOAD_RAISE'] = True
+    client = app.test_client()
+    
+    with app.app_context():
+        engine = db.engine
+        cache.clear()
+    
+    failures = 0
+    for route, budget in QUERY_BUDGETS.items():
+        with count_queries(engine) as queries:
+            response = client.get(route)
+            response.get_data()  # Consume streamed responses so their queries are counted
+        
+        if response.status_code != 200:
+            print(f"  ❌ {route}: HTTP {response.status_code}")
+            failures += 1
+        elif len(queries) > budget:
+            print(f"  ❌ {route}: {len(queries)} queries (budget {budget})")
+            failures += 1
+        else:
+            print(f"  ✅ {route}: {len(queries)} queries (budget {budget})")
+    
+    print("=" * 60)
+    if failures:
+        print(f"❌ {failures} route(s) failed the query count check")
+    else:
+        print("✅ All routes are within their query budgets")
+    
+    return failures == 0
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_query_counts() else 1)
\ No newline at end of file